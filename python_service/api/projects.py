@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 
 from database.connection import get_db
 from services import project_service
-from services.project_scorer import get_project_scorer
+from services.project_scorer import RESCORE_RESULT_CACHE_TTL, get_project_scorer
 from services.freelancer_client import FreelancerAPIError
 
 router = APIRouter()
@@ -177,7 +177,10 @@ async def score_project_with_ai(project_id: int, db: Session = Depends(get_db)):
         scorer.fetch_weights_from_db(db)
 
         # 3. 执行 AI 分析
-        score_result = scorer.score_project(project_dict)
+        # 同一项目短时间内重复触发评分时复用结果
+        score_result = scorer.score_project(
+            project_dict, cache_ttl=RESCORE_RESULT_CACHE_TTL
+        )
 
         # 4. 更新数据库
         updated_data = project_service.update_project_ai_analysis(
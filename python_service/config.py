@@ -68,6 +68,10 @@ class Settings(BaseSettings):
     PROPOSAL_MAX_LENGTH: int = 1800
     PROPOSAL_TARGET_CHAR_MIN: int = 700
     PROPOSAL_TARGET_CHAR_MAX: int = 1200
+    # 限流/超时错误的指数退避（秒）
+    PROPOSAL_RETRY_BASE_DELAY: float = 1.0
+    PROPOSAL_RETRY_MAX_DELAY: float = 30.0
+    PROPOSAL_MAX_CONCURRENCY: int = 20
 
     # Database Configuration
     DATABASE_PATH: str = "/app/data/freelancer.db"
@@ -52,6 +52,31 @@ def _migrate_add_columns(eng):
                 ))
 
 
+# status 索引与「状态统一小写」数据迁移同时引入：索引存在即说明迁移已完成
+_STATUS_INDEX_NAME = "idx_projects_status_created_type"
+
+
+def _migrate_project_indexes(eng):
+    """Normalize project status casing and create indexes missing on existing tables (idempotent)."""
+    from sqlalchemy import text, inspect
+    from .models import Project
+
+    insp = inspect(eng)
+    if "projects" not in insp.get_table_names():
+        return
+    existing = {index["name"] for index in insp.get_indexes("projects")}
+    if _STATUS_INDEX_NAME not in existing:
+        # 一次性数据迁移：状态统一小写存储，查询可直接命中 status 索引（无需 lower(status)）。
+        # 之后所有写入方都已小写，不必在每次启动时全表扫描
+        with eng.begin() as conn:
+            conn.execute(text(
+                "UPDATE projects SET status = lower(status) WHERE status != lower(status)"
+            ))
+    for index in Project.__table__.indexes:
+        if index.name not in existing:
+            index.create(bind=eng, checkfirst=True)
+
+
 def init_db():
     """Initialize database and create all tables."""
     import os
@@ -69,6 +94,7 @@ def init_db():
 
     # Lightweight migrations for new columns on existing tables
     _migrate_add_columns(engine)
+    _migrate_project_indexes(engine)
 
 
 @contextmanager
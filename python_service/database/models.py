@@ -1,15 +1,28 @@
 """
 SQLAlchemy database models for Freelancer automation.
 """
-from sqlalchemy import Column, Integer, String, Text, DECIMAL, Boolean, DateTime, ForeignKey, Index, Float
+from sqlalchemy import Column, Integer, String, Text, DECIMAL, Boolean, DateTime, ForeignKey, Index, Float, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import json
 from .connection import Base
+from utils import json_codec
 
 
 class Project(Base):
     """Projects table for storing fetched project data."""
     __tablename__ = "projects"
+    __table_args__ = (
+        # search_projects: status IN (...) [+ type_id] ORDER BY created_at DESC
+        Index("idx_projects_status_created_type", "status", "created_at", "type_id"),
+        # min_score 过滤只涉及已评分项目
+        Index(
+            "idx_projects_ai_score_scored",
+            "ai_score",
+            sqlite_where=text("ai_score IS NOT NULL"),
+            postgresql_where=text("ai_score IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     freelancer_id = Column(Integer, unique=True, nullable=False, index=True)
@@ -50,40 +63,65 @@ class Project(Base):
 
     def to_dict(self):
         """Convert model to dictionary."""
-        import json
-        # Helper to safely parse JSON fields
-        def safe_json_parse(data):
-            if not data:
-                return None
-            try:
-                return json.loads(data)
-            except (json.JSONDecodeError, ValueError, TypeError):
-                # Return raw string if JSON parsing fails
-                return data
+        return project_to_dict(self)
 
-        return {
-            "id": self.freelancer_id,
-            "title": self.title,
-            "description": self.description,
-            "full_description": self.full_description,
-            "preview_description": self.preview_description,
-            "budget_minimum": float(self.budget_minimum) if self.budget_minimum else None,
-            "budget_maximum": float(self.budget_maximum) if self.budget_maximum else None,
-            "currency_code": self.currency_code,
-            "submitdate": self.submitdate,
-            "status": self.status,
-            "skills": self.skills,
-            "owner_id": self.owner_id,
-            "deadline": self.deadline,
-            "bid_stats": safe_json_parse(self.bid_stats),
-            "owner_info": safe_json_parse(self.owner_info),
-            "ai_score": self.ai_score,
-            "ai_reason": self.ai_reason,
-            "ai_proposal_draft": self.ai_proposal_draft,
-            "estimated_hours": self.estimated_hours,
-            "hourly_rate": self.hourly_rate,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+
+def _safe_json_parse(data):
+    """
+    Safely parse JSON text fields; return raw string if parsing fails.
+
+    Every call returns a freshly parsed object (orjson when available), so
+    callers may mutate the result without affecting other to_dict() results.
+    """
+    if not data:
+        return None
+    try:
+        return json_codec.loads(data)
+    except (json.JSONDecodeError, ValueError, TypeError):
+        return data
+
+
+def project_to_dict(row) -> dict:
+    """
+    Convert a Project (ORM instance or a row selected from PROJECT_DICT_COLUMNS)
+    to the API dictionary shape.
+    """
+    return {
+        "id": row.freelancer_id,
+        "title": row.title,
+        "description": row.description,
+        "full_description": row.full_description,
+        "preview_description": row.preview_description,
+        "budget_minimum": float(row.budget_minimum) if row.budget_minimum else None,
+        "budget_maximum": float(row.budget_maximum) if row.budget_maximum else None,
+        "currency_code": row.currency_code,
+        "submitdate": row.submitdate,
+        "status": row.status,
+        "skills": row.skills,
+        "owner_id": row.owner_id,
+        "deadline": row.deadline,
+        "bid_stats": _safe_json_parse(row.bid_stats),
+        "owner_info": _safe_json_parse(row.owner_info),
+        "ai_score": row.ai_score,
+        "ai_reason": row.ai_reason,
+        "ai_proposal_draft": row.ai_proposal_draft,
+        "estimated_hours": row.estimated_hours,
+        "hourly_rate": row.hourly_rate,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+# Columns read by project_to_dict; select these to skip ORM hydration on list endpoints
+PROJECT_DICT_COLUMNS = tuple(
+    getattr(Project, name)
+    for name in (
+        "freelancer_id", "title", "description", "full_description",
+        "preview_description", "budget_minimum", "budget_maximum", "currency_code",
+        "submitdate", "status", "skills", "owner_id", "deadline", "bid_stats",
+        "owner_info", "ai_score", "ai_reason", "ai_proposal_draft",
+        "estimated_hours", "hourly_rate", "created_at",
+    )
+)
 
 
 class Bid(Base):
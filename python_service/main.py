@@ -12,6 +12,7 @@ from pathlib import Path
 from config import settings
 from database.connection import init_db, get_db_session, verify_api_key
 from services.freelancer_client import get_freelancer_client, FreelancerAPIError
+from services.proposal_prompt_builder import warmup_prompt_builder
 from middleware.error_handler import (
     freelancer_exception_handler,
     general_exception_handler
@@ -36,6 +37,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     init_db()
     logger.info("Database initialized")
+    warmup_prompt_builder()
 
     yield
 
@@ -8,10 +8,14 @@ logger = logging.getLogger(__name__)
 
 from database.models import Bid, Project, AuditLog
 from services.freelancer_client import get_freelancer_client, FreelancerAPIError
-from services.proposal_service import get_proposal_service, ProposalService
+from services.proposal_service import (
+    DefaultProposalValidator,
+    ProposalService,
+    get_proposal_service,
+)
 from utils.currency_converter import get_currency_converter
 
-BIDDABLE_REMOTE_STATUSES = {"open", "active", "open_for_bidding"}
+BIDDABLE_REMOTE_STATUSES = frozenset({"open", "active", "open_for_bidding"})
 
 
 def _coerce_int(value: Any) -> Optional[int]:
@@ -130,8 +134,6 @@ def check_content_risk(description: str, project: Project) -> Tuple[bool, str]:
 
     返回: (是否允许, 风险原因)
     """
-    from services.proposal_service import DefaultProposalValidator
-
     validator = DefaultProposalValidator(min_length=100, max_length=3000)
     project_dict = project.to_dict() if hasattr(project, "to_dict") else {
         "title": project.title,
@@ -15,6 +15,7 @@ or `reset_singleton()` to clear cached state.
 
 from typing import List, Dict, Any, Optional, Tuple, Callable
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -392,11 +393,14 @@ class LLMScoringService:
         client = provider.get_client(provider_config.api_key, provider_config.base_url)
         return provider, client
 
-    def _prepare_project_payload(self, project: Project) -> Dict[str, Any]:
+    def _prepare_project_payload(
+        self, project: Project, converter: Optional[Any] = None
+    ) -> Dict[str, Any]:
         """Prepare project data for LLM scoring (Forces USD conversion)."""
         import ast
 
-        converter = get_currency_converter()
+        if converter is None:
+            converter = get_currency_converter()
         currency_code = project.currency_code or "USD"
 
         # Convert budget to USD to prevent LLM hallucinations with high-value currencies (e.g. INR, IDR)
@@ -614,6 +618,10 @@ class LLMScoringService:
 
     def _aggregate_ensemble(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggregate multiple provider results into a single ensemble output."""
+        # 只有一个 provider 返回结果时无需求平均，直接沿用其 provider_model
+        if len(results) == 1:
+            return dict(results[0])
+
         import statistics
 
         numeric_fields = ["score", "estimated_hours", "hourly_rate"]
@@ -699,6 +707,81 @@ class LLMScoringService:
 
         return True
 
+    async def _score_single_project_impl(
+        self,
+        project: Project,
+        provider_clients: List[Tuple[LLMProvider, Any, LLMProviderConfig]],
+        effective_prompt: str,
+        effective_max_retries: int,
+        prompt_hash: str,
+        converter: Any,
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Score a single project with retry logic and caching."""
+        payload = self._prepare_project_payload(project, converter)
+
+        # 先检查缓存
+        if self._cache:
+            cached_result = self._cache.get_llm_score(payload, prompt_hash)
+            if cached_result:
+                logger.debug(f"Cache hit for project {project.freelancer_id}")
+                return True, cached_result
+
+        for attempt in range(effective_max_retries + 1):
+            success, result = await self._score_with_providers(
+                payload, provider_clients, effective_prompt
+            )
+            if success and result:
+                if self._cache:
+                    self._cache.set_llm_score(payload, result, prompt_hash)
+                return True, result
+
+            # 所有 provider 都失败，退避后重试
+            if attempt < effective_max_retries:
+                await asyncio.sleep(1 + attempt)
+
+        return False, None
+
+    async def _safe_score_single_project(
+        self, project: Project, *args: Any
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Score a single project; never raises so batch siblings are unaffected."""
+        try:
+            return await self._score_single_project_impl(project, *args)
+        except Exception as e:
+            logger.error(f"Batch processing error: {e}")
+            return False, None
+
+    async def _process_batch_impl(
+        self,
+        batch: List[Project],
+        provider_clients: List[Tuple[LLMProvider, Any, LLMProviderConfig]],
+        effective_prompt: str,
+        effective_max_retries: int,
+        prompt_hash: str,
+        converter: Any,
+    ) -> List[Dict[str, Any]]:
+        """Process a batch of projects concurrently."""
+        # _safe_score_single_project 不会抛出异常，无需 return_exceptions 再过滤一遍
+        results = await asyncio.gather(
+            *(
+                self._safe_score_single_project(
+                    p,
+                    provider_clients,
+                    effective_prompt,
+                    effective_max_retries,
+                    prompt_hash,
+                    converter,
+                )
+                for p in batch
+            )
+        )
+
+        return [
+            {"project_id": project.freelancer_id, **result}
+            for project, (success, result) in zip(batch, results)
+            if success and result
+        ]
+
     async def score_projects_concurrent(
         self,
         projects: List[Project],
@@ -758,55 +841,11 @@ class LLMScoringService:
             logger.error("No provider clients could be created")
             return 0, len(projects), 0.0, None
 
-        async def score_single_project(
-            project: Project, retry_count: int = 0
-        ) -> Tuple[bool, Optional[Dict[str, Any]]]:
-            """Score a single project with retry logic and caching."""
-            payload = self._prepare_project_payload(project)
-
-            # 生成提示词哈希作为缓存键的一部分
-            prompt_hash = hashlib.md5((effective_prompt or "").encode()).hexdigest()[:8]
-
-            # 先检查缓存
-            if self._cache:
-                cached_result = self._cache.get_llm_score(payload, prompt_hash)
-                if cached_result:
-                    logger.debug(f"Cache hit for project {project.freelancer_id}")
-                    return True, cached_result
-
-            success, result = await self._score_with_providers(
-                payload, provider_clients, effective_prompt
-            )
-            if success and result:
-                if self._cache:
-                    self._cache.set_llm_score(payload, result, prompt_hash)
-                return True, result
-
-            # 所有 provider 都失败，重试
-            if retry_count < effective_max_retries:
-                await asyncio.sleep(1 + retry_count)
-                return await score_single_project(project, retry_count + 1)
-
-            return False, None
-
-        async def process_batch(batch: List[Project]) -> List[Dict[str, Any]]:
-            """Process a batch of projects concurrently."""
-            tasks = [score_single_project(p) for p in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            scored_results = []
-            for i, res in enumerate(results):
-                if isinstance(res, Exception):
-                    logger.error(f"Batch processing error: {res}")
-                    continue
-
-                success, result = res
-                if success and result:
-                    scored_results.append(
-                        {"project_id": batch[i].freelancer_id, **result}
-                    )
+        # 汇率转换器为单例，整个评分过程只获取一次
+        converter = get_currency_converter()
 
-            return scored_results
+        # 生成提示词哈希作为缓存键的一部分
+        prompt_hash = hashlib.md5((effective_prompt or "").encode()).hexdigest()[:8]
 
         # 处理所有项目
         total_scored = 0
@@ -816,7 +855,14 @@ class LLMScoringService:
 
         for start in range(0, len(projects), effective_batch_size):
             batch = projects[start : start + effective_batch_size]
-            scored = await process_batch(batch)
+            scored = await self._process_batch_impl(
+                batch,
+                provider_clients,
+                effective_prompt,
+                effective_max_retries,
+                prompt_hash,
+                converter,
+            )
 
             # Sanitization and Fallback Logic
             scorer = get_project_scorer()
@@ -847,7 +893,6 @@ class LLMScoringService:
                 est_hours = item.get("estimated_hours")
 
                 # Get USD budget again (safe recalculation)
-                converter = get_currency_converter()
                 curr_code = project_obj.currency_code or "USD"
                 # Properly handle Decimal type from database
                 b_min = (
@@ -1052,7 +1097,6 @@ class LLMScoringService:
 # 单例管理（保留便捷访问，但支持依赖注入）
 # ============================================================================
 
-_scoring_service: Optional["LLMScoringService"] = None
 _scoring_config: Optional[LLMScoringConfig] = None
 
 
@@ -1068,9 +1112,9 @@ def reset_singleton() -> None:
         def setUp(self):
             reset_singleton()
     """
-    global _scoring_service, _scoring_config
-    _scoring_service = None
+    global _scoring_config
     _scoring_config = None
+    _build_scoring_service.cache_clear()
     logger.debug("LLMScoringService singleton reset")
 
 
@@ -1103,6 +1147,12 @@ def create_scoring_service(
     return LLMScoringService(config=config)
 
 
+@functools.lru_cache(maxsize=1)
+def _build_scoring_service() -> "LLMScoringService":
+    """按当前 _scoring_config 构建单例（lru_cache 缓存，配置变更时 cache_clear）。"""
+    return create_scoring_service(_scoring_config)
+
+
 def get_scoring_service() -> "LLMScoringService":
     """
     获取或创建单例评分服务（便捷访问）。
@@ -1114,11 +1164,7 @@ def get_scoring_service() -> "LLMScoringService":
     Returns:
         单例 LLMScoringService 实例
     """
-    global _scoring_service, _scoring_config
-    if _scoring_service is None:
-        config = _scoring_config
-        _scoring_service = create_scoring_service(config)
-    return _scoring_service
+    return _build_scoring_service()
 
 
 def configure_service(config: LLMScoringConfig) -> None:
@@ -1136,5 +1182,5 @@ def configure_service(config: LLMScoringConfig) -> None:
     """
     global _scoring_config
     _scoring_config = config
-    _scoring_service = None  # 标记需要重建
+    _build_scoring_service.cache_clear()  # 下次获取时按新配置重建
     logger.info("LLMScoringService configured with custom settings")
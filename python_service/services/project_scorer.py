@@ -14,14 +14,21 @@ For testing, use `create_project_scorer()` to create fresh instances
 or `reset_singleton()` to clear cached state.
 """
 
+from bisect import bisect_right
+import functools
+import hashlib
+import json
 import logging
 import time
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from types import MappingProxyType
 
 from config import settings
-from utils.currency_converter import get_currency_converter
+from utils.currency_converter import get_currency_converter, rates_version
+from utils.keyword_matcher import KeywordMatcher
+from services.scoring_cache import MemoryCacheBackend
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -35,6 +42,150 @@ DEFAULT_WEIGHTS = {
     "tech": 0.10,
     "risk": 0.05,
 }
+# 评分结果缓存默认 TTL（秒）：默认关闭，缓存键需对整个项目做内容哈希，冷调用反而更慢
+_DEFAULT_RESULT_CACHE_TTL = 0
+# 重复评分路径（如手动重新评分接口）按调用开启缓存时使用的 TTL（秒）
+RESCORE_RESULT_CACHE_TTL = 300
+# 新鲜度加分窗口（秒）：24h 内发布的项目竞争得分 +1
+_RECENT_WINDOW_SECONDS = 24 * 3600
+
+# 只读共享默认权重：未被修改时无需为每个实例复制
+_DEFAULT_WEIGHTS = MappingProxyType(dict(DEFAULT_WEIGHTS))
+
+
+# 工时估算关键词（标题 / 标题+描述 各自一次扫描）
+_HOURS_TITLE_MATCHER = KeywordMatcher(
+    {
+        "mobile": ["mobile", "app", "ios", "android"],
+        "website": ["website", "full stack"],
+        "api": ["api", "integration"],
+        "scraping": ["scraping", "scraper"],
+        "automation": ["automation", "bot"],
+    }
+)
+_HOURS_TEXT_MATCHER = KeywordMatcher(
+    {
+        "mobile": ["mobile", "app", "ios", "android"],
+        "web": ["web"],
+        "agent": ["multimodal", "agent"],
+        "ml": [
+            "machine learning",
+            "ml ",
+            "deep learning",
+            "neural network",
+            "nlp",
+            "llm",
+            "ai ",
+            "artificial intelligence",
+        ],
+        "workflow": ["workflow", "zapier", "make", "airflow"],
+        "small_task": ["fix", "bug", "small", "tweak", "script", "update"],
+    }
+)
+
+
+def _hours_from_hits(
+    title_hits: Dict[str, List[str]], text_hits: Dict[str, List[str]]
+) -> float:
+    """
+    Pure arithmetic part of the hours estimate, driven by keyword-group hits.
+
+    Kept free of string scanning and instance state so it stays a tight
+    numeric kernel (keyword matching happens once, before this is called).
+    """
+    hours = 0
+
+    # 1. Base hours from platform/type
+    if "mobile" in title_hits:
+        hours += 80
+    elif "mobile" in text_hits:
+        hours += 40
+
+    if "website" in title_hits:
+        hours += 40
+    elif "web" in text_hits:
+        hours += 20
+
+    if "api" in title_hits:
+        hours += 20
+    if "scraping" in title_hits:
+        hours += 15
+    if "automation" in title_hits:
+        hours += 20
+
+    # 2. AI/ML/Agent complexity
+    if "agent" in text_hits:
+        hours += 40
+    elif "ml" in text_hits:
+        hours += 30
+
+    # 3. Integration complexity (workflow/orchestration tools)
+    if "workflow" in text_hits:
+        hours += 15
+
+    small_hits = len(text_hits.get("small_task", ()))
+    if small_hits:
+        multiplier = 0.3
+        if small_hits >= 2:
+            multiplier = 0.2
+        if small_hits >= 3:
+            multiplier = 0.1
+        hours = hours * multiplier
+
+    return hours
+
+
+# 预算效率曲线的分段表：断点 + 每段 (base, x0, span, delta)，
+# 段内得分 = base + (rate - x0) / span * delta。
+# 60 处曲线不连续（左侧趋近 10，右侧从 8 开始），因此用分段表而非插值。
+_BUDGET_RATE_CAP = 120.0  # 超过该时薪后得分恒为 4.0
+_BUDGET_KNOTS = (15.0, 20.0, 60.0, 80.0)
+_BUDGET_SEGMENTS = (
+    (0.0, 0.0, 15.0, 6.0),     # [0, 15): 0 -> 6
+    (6.0, 15.0, 5.0, 2.0),     # [15, 20): 6 -> 8
+    (8.0, 20.0, 40.0, 2.0),    # [20, 60): 8 -> 10
+    (6.0, 80.0, -20.0, 2.0),   # [60, 80): 8 -> 6
+    (6.0, 80.0, 40.0, -2.0),   # [80, 120]: 6 -> 4
+)
+
+
+def _budget_efficiency_score(hourly_rate: float) -> float:
+    """Piecewise budget-efficiency curve (0-10) over the USD hourly rate."""
+    # 先截断到 [0, 120]（NaN 归为 0），再用一次二分查找定位分段
+    rate = max(0.0, min(hourly_rate, _BUDGET_RATE_CAP))
+    base, x0, span, delta = _BUDGET_SEGMENTS[bisect_right(_BUDGET_KNOTS, rate)]
+    return base + (rate - x0) / span * delta
+
+
+# 货币代码/符号 -> ISO 代码（只读，模块加载时构建一次）
+_CURRENCY_MAP = MappingProxyType(
+    {
+        "US": "USD",
+        "EU": "EUR",
+        "GB": "GBP",
+        "CA": "CAD",
+        "AU": "AUD",
+        "SG": "SGD",
+        "NZ": "NZD",
+        "HK": "HKD",
+        "JP": "JPY",
+        "CN": "CNY",
+        "MY": "MYR",
+        "PH": "PHP",
+        "TH": "THB",
+        "IN": "INR",
+        "$": "USD",
+        "€": "EUR",
+        "£": "GBP",
+        "₹": "INR",
+        "¥": "JPY",
+        "₱": "PHP",
+        "฿": "THB",
+        "₩": "KRW",
+        "R$": "BRL",
+        "₽": "RUB",
+    }
+)
 
 
 class ProjectComplexity(Enum):
@@ -44,7 +195,11 @@ class ProjectComplexity(Enum):
     LARGE = (80, 200)
 
 
-@dataclass
+# 工时估算上下限（= TRIVIAL 下限 / LARGE 上限），热路径直接使用常量
+_HOURS_MIN, _HOURS_MAX = ProjectComplexity.TRIVIAL.value[0], ProjectComplexity.LARGE.value[1]
+
+
+@dataclass(frozen=True, slots=True)
 class ScoreBreakdown:
     """Breakdown of scores by category (each 0-10)."""
 
@@ -58,7 +213,12 @@ class ScoreBreakdown:
     risk_score: float = 0.0
 
 
-@dataclass
+_BREAKDOWN_SCORE_FIELDS = frozenset(
+    f.name for f in fields(ScoreBreakdown) if f.name.endswith("_score")
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectScore:
     """Complete project score with analysis."""
 
@@ -70,7 +230,7 @@ class ProjectScore:
     score_breakdown: ScoreBreakdown
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringConfig:
     """
     评分配置（依赖注入友好）。
@@ -87,23 +247,16 @@ class ScoringConfig:
         max_hours: 最大工时估算，默认500小时
         risk_keywords: 自定义风险关键词（覆盖默认）
         currency_rates: 自定义汇率映射（覆盖默认）
+        result_cache_ttl: 评分结果缓存 TTL（秒），0（默认）表示禁用缓存
     """
 
-    weights: Dict[str, float] = field(
-        default_factory=lambda: {
-            "budget_efficiency": 0.15,
-            "competition": 0.25,
-            "clarity": 0.25,
-            "customer": 0.20,
-            "tech": 0.10,
-            "risk": 0.05,
-        }
-    )
+    weights: Dict[str, float] = field(default_factory=_DEFAULT_WEIGHTS.copy)
     user_skills: Optional[List[str]] = None
-    min_hours: int = ProjectComplexity.TRIVIAL.value[0]
-    max_hours: int = ProjectComplexity.LARGE.value[1]
+    min_hours: int = _HOURS_MIN
+    max_hours: int = _HOURS_MAX
     risk_keywords: Optional[Dict[str, List[str]]] = None
     currency_rates: Optional[Dict[str, float]] = None
+    result_cache_ttl: int = _DEFAULT_RESULT_CACHE_TTL
 
     def __post_init__(self):
         """验证配置有效性"""
@@ -115,6 +268,110 @@ class ScoringConfig:
             )
 
 
+@dataclass(slots=True)
+class _ProjectText:
+    """
+    项目文本的小写化视图（每个项目只构建一次，供各评分维度共享）。
+
+    各维度沿用各自原有的描述字段回退顺序；当 full_description 存在时
+    （常见情况）它们指向同一个小写字符串，只做一次 lower()。
+    """
+
+    title_lower: str
+    description: str
+    desc_lower: str
+    combined_lower: str
+    full_combined_lower: str
+    tech_desc_lower: str
+
+    @classmethod
+    def from_project(cls, project: Dict[str, Any]) -> "_ProjectText":
+        get = project.get
+        title_lower = (get("title") or "").lower()
+        full_description = get("full_description")
+        description = (
+            full_description
+            or get("description")
+            or get("preview_description")
+            or ""
+        )
+        desc_lower = description.lower()
+        combined_lower = f"{title_lower} {desc_lower}"
+
+        if full_description:
+            full_combined_lower = combined_lower
+            tech_desc_lower = desc_lower
+        else:
+            full_combined_lower = f"{title_lower} "
+            tech_desc_lower = (get("preview_description") or "").lower()
+
+        return cls(
+            title_lower=title_lower,
+            description=description,
+            desc_lower=desc_lower,
+            combined_lower=combined_lower,
+            full_combined_lower=full_combined_lower,
+            tech_desc_lower=tech_desc_lower,
+        )
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass(slots=True)
+class _OwnerSnapshot:
+    """项目发布者信息的规范化视图（每个项目只解析一次 owner_info）。"""
+
+    payment_verified: bool
+    verified: bool
+    jobs_posted: int
+    jobs_hired: int
+    online: bool
+    rating: float
+
+    @classmethod
+    def from_project(cls, project: Dict[str, Any]) -> Optional["_OwnerSnapshot"]:
+        """Parse project["owner_info"]; None when the info is missing."""
+        owner_info = project.get("owner_info")
+        if not owner_info or not isinstance(owner_info, dict):
+            return None
+        get = owner_info.get
+        return cls(
+            payment_verified=bool(get("payment_verified")),
+            verified=bool(get("verified")),
+            jobs_posted=_to_int(get("jobs_posted", 0)),
+            jobs_hired=_to_int(get("jobs_hired", 0)),
+            online=get("online_status") == "online",
+            rating=_to_float(get("rating", 0)),
+        )
+
+
+def _recent_threshold() -> float:
+    """当前时刻往前推 24h 的时间戳（项目新鲜度阈值）。"""
+    return time.time() - _RECENT_WINDOW_SECONDS
+
+
+@dataclass(slots=True)
+class _ScoringBatch:
+    """一批项目共享的评分状态（每批只构建一次）。"""
+
+    # 汇率快照：每种货币在一批内只向转换器查询一次
+    rates: Dict[str, Optional[float]] = field(default_factory=dict)
+    # 新鲜度阈值：整批共用同一时钟快照（submitdate >= 阈值即视为 24h 内发布）
+    recent_threshold: float = field(default_factory=lambda: _recent_threshold())
+
+
 class RequirementQualityScorer:
     """Helper class for multi-dimensional requirement quality scoring."""
 
@@ -148,30 +405,41 @@ class RequirementQualityScorer:
             "vague_keywords",
             ["optimize", "improve", "insights", "better", "best way", "enhancement"],
         )
+        # 四组关键词编译为一个匹配器，评分时只扫描一次描述
+        self._matcher = KeywordMatcher(
+            {
+                "deliverable": self.deliverable_kws,
+                "acceptance": self.acceptance_kws,
+                "tech_spec": self.tech_spec_kws,
+                "vague": self.vague_kws,
+            }
+        )
 
-    def score(self, description: str) -> float:
+    def score(self, description: str, desc_lower: Optional[str] = None) -> float:
         if not description:
             return 0.0
 
-        desc_lower = description.lower()
+        if desc_lower is None:
+            desc_lower = description.lower()
         score = 0.0
+        hits = self._matcher.find(desc_lower)
 
         # 1. Deliverables (30% -> 3.0 pts)
-        if any(kw in desc_lower for kw in self.deliverable_kws):
+        if "deliverable" in hits:
             score += 3.0
 
         # 2. Acceptance Criteria (25% -> 2.5 pts)
-        if any(kw in desc_lower for kw in self.acceptance_kws):
+        if "acceptance" in hits:
             score += 2.5
 
         # 3. Tech Specs (25% -> 2.5 pts)
         # Use more specific matching for tech stack
-        matched_tech = [kw for kw in self.tech_spec_kws if kw in desc_lower]
+        matched_tech = hits.get("tech_spec", ())
         if matched_tech:
             score += min(len(matched_tech) * 0.5, 2.5)
 
         # 4. No Vague Terms (15% -> 1.5 pts)
-        vague_count = sum(1 for kw in self.vague_kws if kw in desc_lower)
+        vague_count = len(hits.get("vague", ()))
         vague_penalty = min(vague_count * 0.5, 1.5)
         score += 1.5 - vague_penalty
 
@@ -274,6 +542,9 @@ class ProjectScorer:
         ],
     }
 
+    # 评分结果缓存最大条目数
+    RESULT_CACHE_MAX_SIZE = 10_000
+
     def __init__(self, config: Optional[ScoringConfig] = None):
         """
         Initialize scorer with optional configuration.
@@ -284,11 +555,11 @@ class ProjectScorer:
         rules = settings.scoring_rules
         self.config = config
         self.weights = (
-            config.weights if config else rules.get("weights", DEFAULT_WEIGHTS.copy())
+            config.weights if config else rules.get("weights", _DEFAULT_WEIGHTS)
         )
         self.user_skills = config.user_skills if config else settings.DEFAULT_SKILLS
-        self.min_hours = config.min_hours if config else ProjectComplexity.TRIVIAL.value[0]
-        self.max_hours = config.max_hours if config else ProjectComplexity.LARGE.value[1]
+        self.min_hours = config.min_hours if config else _HOURS_MIN
+        self.max_hours = config.max_hours if config else _HOURS_MAX
 
         # Load risk keywords from YAML if available, otherwise use defaults
         if config and config.risk_keywords:
@@ -296,6 +567,26 @@ class ProjectScorer:
         else:
             self.risk_keywords = rules.get("risk_keywords", self.DEFAULT_RISK_KEYWORDS)
 
+        # 风险关键词（按类别）与技能匹配关键词在构造时编译一次
+        self._risk_matcher = KeywordMatcher(self.risk_keywords)
+        self._skill_matcher = KeywordMatcher(
+            {"skills": [skill.lower() for skill in self.user_skills or []]}
+        )
+        # 评分结果缓存：同一项目内容在 TTL 内重复评分时直接复用结果
+        self._result_cache_ttl = (
+            config.result_cache_ttl if config else _DEFAULT_RESULT_CACHE_TTL
+        )
+        self._result_cache = MemoryCacheBackend(max_size=self.RESULT_CACHE_MAX_SIZE)
+
+        # scoring_rules 在进程内只加载一次，构造时解析，避免每个项目重复读取
+        self._rules = rules
+        self._customer_rules = rules.get("customer", {})
+        self._risk_penalty_multiplier = rules.get("risk", {}).get(
+            "penalty_multiplier", 0.5
+        )
+        self._quality_scorer = RequirementQualityScorer(config=rules)
+        self._refresh_effective_weights()
+
         logger.debug(
             f"ProjectScorer initialized with weights={self.weights}, "
             f"skills={self.user_skills}"
@@ -307,12 +598,26 @@ class ProjectScorer:
         rules = db.query(ScoringRule).filter(ScoringRule.is_active == True).all()
         if rules:
             new_weights = {rule.name: rule.weight for rule in rules}
+            # 共享的只读默认权重在首次修改时才复制（copy-on-write）
+            if isinstance(self.weights, MappingProxyType):
+                self.weights = dict(self.weights)
             # Only update weights that exist in our default weights to avoid unknown dimensions
             for name, weight in new_weights.items():
                 if name in self.weights:
                     self.weights[name] = weight
+            self._refresh_effective_weights()
             logger.info(f"Updated scoring weights from DB: {self.weights}")
 
+    def _refresh_effective_weights(self) -> None:
+        """Resolve the weights used for totals (YAML weights win over scorer weights)."""
+        self._effective_weights = self._rules.get("weights", self.weights)
+        # (ScoreBreakdown 属性名, 权重)，未知维度已在此剔除
+        self._weighted_attrs: Tuple[Tuple[str, float], ...] = tuple(
+            (f"{dimension}_score", weight)
+            for dimension, weight in self._effective_weights.items()
+            if f"{dimension}_score" in _BREAKDOWN_SCORE_FIELDS
+        )
+
     @property
     def RISK_KEYWORDS(self) -> Dict[str, List[str]]:
         """获取风险关键词配置（支持覆盖）"""
@@ -325,56 +630,49 @@ class ProjectScorer:
         if not currency_code:
             return "USD"
 
-        code = str(currency_code).strip().upper()
-
-        currency_map = {
-            "US": "USD",
-            "EU": "EUR",
-            "GB": "GBP",
-            "CA": "CAD",
-            "AU": "AUD",
-            "SG": "SGD",
-            "NZ": "NZD",
-            "HK": "HKD",
-            "JP": "JPY",
-            "CN": "CNY",
-            "MY": "MYR",
-            "PH": "PHP",
-            "TH": "THB",
-            "IN": "INR",
-            "$": "USD",
-            "€": "EUR",
-            "£": "GBP",
-            "₹": "INR",
-            "¥": "JPY",
-            "₱": "PHP",
-            "฿": "THB",
-            "₩": "KRW",
-            "R$": "BRL",
-            "₽": "RUB",
-        }
-
-        if code in currency_map:
-            return currency_map[code]
+        if currency_code.__class__ is not str:
+            currency_code = str(currency_code)
+        code = currency_code.strip().upper()
+
+        mapped = _CURRENCY_MAP.get(code)
+        if mapped is not None:
+            return mapped
 
         if len(code) == 3 and code.isalpha():
             return code
 
         return "USD"
 
-    def _get_currency_rate(self, currency_code: str) -> Optional[float]:
+    def _get_currency_rate(
+        self, currency_code: str, rates: Optional[Dict[str, Optional[float]]] = None
+    ) -> Optional[float]:
         """
         Get exchange rate for currency to USD using dynamic converter.
-        """
-        converter = get_currency_converter()
-        return converter.get_rate_sync(currency_code)
 
-    def _convert_to_usd(self, amount: float, currency_code: str) -> Optional[float]:
+        When a batch rate snapshot is given, each currency is looked up once
+        and reused for the rest of the batch.
+        """
+        if rates is not None and currency_code in rates:
+            return rates[currency_code]
+        rate = get_currency_converter().get_rate_sync(currency_code)
+        if rates is not None:
+            rates[currency_code] = rate
+        return rate
+
+    def _convert_to_usd(
+        self,
+        amount: float,
+        currency_code: str,
+        rates: Optional[Dict[str, Optional[float]]] = None,
+    ) -> Optional[float]:
         """
         Convert amount to USD.
         """
+        # 最常见的 USD 项目无需规范化和查询汇率
+        if not currency_code or currency_code == "USD":
+            return amount
         normalized_code = self._normalize_currency_code(currency_code)
-        rate = self._get_currency_rate(normalized_code)
+        rate = self._get_currency_rate(normalized_code, rates)
         if rate is None:
             return None
         return amount * rate
@@ -394,100 +692,59 @@ class ProjectScorer:
         else:
             return "D"
 
-    def estimate_project_hours(self, project: Dict[str, Any]) -> int:
+    def estimate_project_hours(
+        self, project: Dict[str, Any], text: Optional[_ProjectText] = None
+    ) -> int:
         """
         Estimate project hours based purely on technical complexity and keywords.
 
         Returns:
             Estimated hours (clamped to min/max configured)
         """
-        hours = 0
-        title = project.get("title", "").lower()
-        description = (project.get("full_description") or "").lower()
-        combined_text = f"{title} {description}"
-
-        # 1. Base hours from platform/type
-        if any(kw in title for kw in ["mobile", "app", "ios", "android"]):
-            hours += 80
-        elif any(kw in combined_text for kw in ["mobile", "app", "ios", "android"]):
-            hours += 40
-
-        if "website" in title or "full stack" in title:
-            hours += 40
-        elif "web" in combined_text:
-            hours += 20
-
-        if "api" in title or "integration" in title:
-            hours += 20
-        if "scraping" in title or "scraper" in title:
-            hours += 15
-        if "automation" in title or "bot" in title:
-            hours += 20
-
-        # 2. AI/ML/Agent complexity
-        if "multimodal" in combined_text or "agent" in combined_text:
-            hours += 40
-        elif any(
-            kw in combined_text
-            for kw in [
-                "machine learning",
-                "ml ",
-                "deep learning",
-                "neural network",
-                "nlp",
-                "llm",
-                "ai ",
-                "artificial intelligence",
-            ]
-        ):
-            hours += 30
-
-        # 3. Integration complexity (workflow/orchestration tools)
-        if any(kw in combined_text for kw in ["workflow", "zapier", "make", "airflow"]):
-            hours += 15
-
-        small_task_keywords = ["fix", "bug", "small", "tweak", "script", "update"]
-        small_hits = sum(1 for kw in small_task_keywords if kw in combined_text)
-        if small_hits:
-            multiplier = 0.3
-            if small_hits >= 2:
-                multiplier = 0.2
-            if small_hits >= 3:
-                multiplier = 0.1
-            hours = hours * multiplier
-
-        min_hours = max(self.min_hours, ProjectComplexity.TRIVIAL.value[0])
-        max_hours = min(self.max_hours, ProjectComplexity.LARGE.value[1])
+        if text is None:
+            text = _ProjectText.from_project(project)
+        hours = _hours_from_hits(
+            _HOURS_TITLE_MATCHER.find(text.title_lower),
+            _HOURS_TEXT_MATCHER.find(text.full_combined_lower),
+        )
+
+        min_hours = max(self.min_hours, _HOURS_MIN)
+        max_hours = min(self.max_hours, _HOURS_MAX)
         estimated = int(round(hours)) if hours > 0 else 0
         estimated = max(min_hours, min(estimated, max_hours))
-        logger.debug(f"Estimated {estimated} hours for project {project.get('id')}")
+        logger.debug("Estimated %s hours for project %s", estimated, project.get('id'))
         return estimated
 
     def score_budget_efficiency(
-        self, project: Dict[str, Any], estimated_hours: int
+        self,
+        project: Dict[str, Any],
+        estimated_hours: int,
+        rates: Optional[Dict[str, Optional[float]]] = None,
     ) -> Tuple[float, float]:
         """
         Score budget efficiency (0-10 points) based on USD hourly rate.
         Returns (score, hourly_rate).
         """
-        project_id = project.get("id", "unknown")
-        budget_info = project.get("budget", {})
+        get = project.get
+        project_id = get("id", "unknown")
+        budget_info = get("budget", {})
         budget_min = float(budget_info.get("minimum", 0) or 0)
         budget_max = float(budget_info.get("maximum", 0) or 0)
 
         currency_code = (
-            project.get("currency_code")
-            or project.get("currency", {}).get("code")
+            get("currency_code")
+            or get("currency", {}).get("code")
             or "USD"
         )
 
         avg_budget_usd = self._convert_to_usd(
             (budget_min + budget_max) / 2,
             currency_code,
+            rates,
         )
         if avg_budget_usd is None:
             return 5.0, 0.0
-        project_type = project.get("type", project.get("type_id", "fixed"))
+        project_type = get("type", get("type_id", "fixed"))
 
         if project_type == "hourly":
             hourly_rate = avg_budget_usd
@@ -497,37 +754,28 @@ class ProjectScorer:
             hourly_rate = avg_budget_usd / estimated_hours
 
         logger.debug(
-            f"Project {project_id}: Normalized hourly rate {hourly_rate:.2f} USD/h"
+            "Project %s: Normalized hourly rate %.2f USD/h", project_id, hourly_rate
         )
 
-        score = 0.0
-        if hourly_rate >= 80:
-            score = max(4.0, 6.0 - (hourly_rate - 80) / 40 * 2.0)
-        elif hourly_rate >= 60:
-            score = 6.0 + (80 - hourly_rate) / 20 * 2.0
-        elif hourly_rate >= 20:
-            score = 8.0 + (hourly_rate - 20) / 40 * 2.0
-        elif hourly_rate >= 15:
-            score = 6.0 + (hourly_rate - 15) / 5 * 2.0
-        else:
-            score = max(0.0, hourly_rate / 15 * 6.0)
+        return _budget_efficiency_score(hourly_rate), hourly_rate
 
-        return score, hourly_rate
-
-    def score_requirement_quality(self, project: Dict[str, Any]) -> float:
+    def score_requirement_quality(
+        self, project: Dict[str, Any], text: Optional[_ProjectText] = None
+    ) -> float:
         """
         Score requirement quality with multi-dimensional evaluation (0-10 points).
         """
-        description = (
-            project.get("full_description")
-            or project.get("description")
-            or project.get("preview_description", "")
-        )
+        if text is None:
+            text = _ProjectText.from_project(project)
 
-        scorer = RequirementQualityScorer(config=settings.scoring_rules)
-        return scorer.score(description)
+        return self._quality_scorer.score(text.description, text.desc_lower)
 
-    def score_competition(self, project: Dict[str, Any], competition_analysis: Optional[Dict[str, Any]] = None) -> float:
+    def score_competition(
+        self,
+        project: Dict[str, Any],
+        competition_analysis: Optional[Dict[str, Any]] = None,
+        recent_threshold: Optional[float] = None,
+    ) -> float:
         """
         Score competition level (0-10 points).
 
@@ -541,17 +789,26 @@ class ProjectScorer:
         - active_bids 16-30: 得分 7.0（中等竞争）
         - active_bids 31-50: 得分 4.0（激烈竞争）
         - active_bids > 50: 得分 2.0（过度竞争）
+
+        *recent_threshold* 为 24h 新鲜度阈值时间戳；批量评分时由调用方统一传入，
+        缺省时按当前时间计算。
         """
+        if recent_threshold is None:
+            recent_threshold = _recent_threshold()
+
         if competition_analysis and competition_analysis.get("active_bids") is not None:
-            return self._score_competition_from_analysis(competition_analysis, project)
+            return self._score_competition_from_analysis(
+                competition_analysis, project, recent_threshold
+            )
 
         # Fallback: bid_count heuristic
-        return self._score_competition_from_bid_count(project)
+        return self._score_competition_from_bid_count(project, recent_threshold)
 
     def _score_competition_from_analysis(
         self,
         analysis: Dict[str, Any],
         project: Dict[str, Any],
+        recent_threshold: Optional[float] = None,
     ) -> float:
         """Score competition using real competitor bid data."""
         active = analysis.get("active_bids", 0)
@@ -576,10 +833,12 @@ class ProjectScorer:
             score = max(0.0, score - 1.0)
 
         # Recency bonus (same as fallback)
-        score = self._apply_recency_bonus(score, project)
+        score = self._apply_recency_bonus(score, project, recent_threshold)
         return score
 
-    def _score_competition_from_bid_count(self, project: Dict[str, Any]) -> float:
+    def _score_competition_from_bid_count(
+        self, project: Dict[str, Any], recent_threshold: Optional[float] = None
+    ) -> float:
         """Original bid_count-based competition scoring (backward-compatible)."""
         bid_stats = project.get("bid_stats", {})
         bid_count = bid_stats.get("bid_count", 0)
@@ -593,96 +852,103 @@ class ProjectScorer:
         else:
             score = 2.0
 
-        score = self._apply_recency_bonus(score, project)
+        score = self._apply_recency_bonus(score, project, recent_threshold)
         return score
 
     @staticmethod
-    def _apply_recency_bonus(score: float, project: Dict[str, Any]) -> float:
-        """Add +1 bonus if project was submitted within 24 hours."""
-        submitdate = project.get("submitdate")
-        if submitdate:
-            try:
-                submit_ts = float(submitdate)
-                if submit_ts > 1_000_000_000_000:
-                    submit_ts = submit_ts / 1000.0
-                if time.time() - submit_ts <= 24 * 3600:
-                    score = min(10.0, score + 1.0)
-            except (TypeError, ValueError):
-                pass
+    def _apply_recency_bonus(
+        score: float, project: Dict[str, Any], recent_threshold: Optional[float] = None
+    ) -> float:
+        """Add +1 bonus if project was submitted within 24 hours (submit_ts >= recent_threshold)."""
+        if ProjectScorer._is_recent(project, recent_threshold):
+            score = min(10.0, score + 1.0)
         return score
 
-    def detect_risk_keywords(self, project: Dict[str, Any]) -> Dict[str, List[str]]:
+    @staticmethod
+    def _is_recent(project: Dict[str, Any], recent_threshold: Optional[float] = None) -> bool:
+        """Whether the project was submitted within 24 hours (submit_ts >= recent_threshold)."""
+        submitdate = project.get("submitdate")
+        if not submitdate:
+            return False
+        try:
+            submit_ts = float(submitdate)
+        except (TypeError, ValueError):
+            return False
+        if submit_ts > 1_000_000_000_000:
+            submit_ts = submit_ts / 1000.0
+        if recent_threshold is None:
+            recent_threshold = _recent_threshold()
+        return submit_ts >= recent_threshold
+
+    def detect_risk_keywords(
+        self, project: Dict[str, Any], text: Optional[_ProjectText] = None
+    ) -> Dict[str, List[str]]:
         """
         Detect risk keywords in project description.
         """
-        description = (
-            project.get("full_description")
-            or project.get("description")
-            or project.get("preview_description", "")
-        ).lower()
-        title = project.get("title", "").lower()
-        combined_text = f"{title} {description}"
-        detected_risks: Dict[str, List[str]] = {}
-
-        for category, keywords in self.RISK_KEYWORDS.items():
-            found_keywords = [kw for kw in keywords if kw in combined_text]
-            if found_keywords:
-                detected_risks[category] = found_keywords
-        return detected_risks
-
-    def score_customer(self, project: Dict[str, Any]) -> float:
+        if text is None:
+            text = _ProjectText.from_project(project)
+        # 单次扫描文本，按类别归并命中的关键词（未命中的类别不出现）
+        return self._risk_matcher.find(text.combined_lower)
+
+    def score_customer(
+        self, project: Dict[str, Any], owner: Optional[_OwnerSnapshot] = None
+    ) -> float:
         """
         Score customer activity/trust (0-10 points).
         """
-        rules = settings.scoring_rules.get("customer", {})
-        score = 7.0  # Base score
-        owner_info = project.get("owner_info")
-        if not owner_info:
+        if owner is None:
+            owner = _OwnerSnapshot.from_project(project)
+        if owner is None:
             return 5.0  # Neutral score for missing info
 
+        get_rule = self._customer_rules.get  # 热路径：绑定为局部变量
+        score = 7.0  # Base score
+
         # 1. Payment Verification
-        if not owner_info.get("payment_verified"):
-            score += rules.get("payment_not_verified_penalty", 0.0)
+        if not owner.payment_verified:
+            score += get_rule("payment_not_verified_penalty", 0.0)
         else:
-            score += rules.get("payment_verified_bonus", 1.0)
+            score += get_rule("payment_verified_bonus", 1.0)
 
         # 2. Hire Rate
-        jobs_posted = int(owner_info.get("jobs_posted", 0))
-        jobs_hired = int(owner_info.get("jobs_hired", 0))
+        jobs_posted = owner.jobs_posted
+        jobs_hired = owner.jobs_hired
         hire_rate = jobs_hired / jobs_posted if jobs_posted > 0 else 0
 
-        if jobs_posted > 0 and hire_rate < rules.get("low_hire_rate_threshold", 0.40):
-            score += rules.get("low_hire_rate_penalty", -1.0)
+        if jobs_posted > 0 and hire_rate < get_rule("low_hire_rate_threshold", 0.40):
+            score += get_rule("low_hire_rate_penalty", -1.0)
 
         # 3. New Customer
         if jobs_posted == 0:
-            score += rules.get("new_customer_penalty", 0.0)
+            score += get_rule("new_customer_penalty", 0.0)
 
         # 4. Activity
-        if owner_info.get("online_status") == "online":
-            score += rules.get("online_bonus", 2.0)
+        if owner.online:
+            score += get_rule("online_bonus", 2.0)
 
         # 5. Reputation
-        rating = float(owner_info.get("rating", 0))
+        rating = owner.rating
         if rating >= 4.5:
-            score += rules.get("rating_4_5_bonus", 3.0)
+            score += get_rule("rating_4_5_bonus", 3.0)
         elif rating >= 4.0:
             score += 1.5
 
         return max(0.0, min(score, 10.0))
 
-    def score_tech_match(self, project: Dict[str, Any]) -> float:
+    def score_tech_match(
+        self, project: Dict[str, Any], text: Optional[_ProjectText] = None
+    ) -> float:
         """
         Score technical skill matching (0-10 points).
         """
-        title = project.get("title", "").lower()
-        description = (
-            project.get("full_description") or project.get("preview_description") or ""
-        ).lower()
-        matched_skills = 0
-        for skill in self.user_skills:
-            if skill.lower() in title or skill.lower() in description:
-                matched_skills += 1
+        if text is None:
+            text = _ProjectText.from_project(project)
+        matched_skills = len(
+            self._skill_matcher.find(text.title_lower, text.tech_desc_lower).get(
+                "skills", ()
+            )
+        )
         if matched_skills >= 3:
             return 10.0
         elif matched_skills >= 2:
@@ -691,18 +957,21 @@ class ProjectScorer:
             return 4.0
         return 0.0
 
-    def score_risk(self, project: Dict[str, Any]) -> float:
+    def score_risk(
+        self, project: Dict[str, Any], owner: Optional[_OwnerSnapshot] = None
+    ) -> float:
         """
         Score project risk (0-10 points, higher = less risky).
         """
+        if owner is None:
+            owner = _OwnerSnapshot.from_project(project)
         score = 7.0
-        owner_info = project.get("owner_info")
-        if owner_info:
-            if owner_info.get("verified"):
+        if owner is not None:
+            if owner.verified:
                 score += 1.5
-            if owner_info.get("payment_verified"):
+            if owner.payment_verified:
                 score += 1.5
-            jobs_posted = owner_info.get("jobs_posted", 0)
+            jobs_posted = owner.jobs_posted
             if jobs_posted == 0:
                 score -= 0.5  # Minimal penalty for new clients
             elif jobs_posted < 5:
@@ -713,29 +982,35 @@ class ProjectScorer:
         self, breakdown: ScoreBreakdown, project: Dict[str, Any]
     ) -> str:
         """Generate human-readable reasoning."""
-        reasons = []
-        budget_info = project.get("budget", {})
-        currency = project.get("currency_code") or "USD"
-
-        if breakdown.budget_efficiency_score >= 8.0:
-            reasons.append(f"预算优秀 (${breakdown.hourly_rate:.1f}/h)")
-        elif breakdown.budget_efficiency_score >= 6.0:
-            reasons.append(f"预算合理 (${breakdown.hourly_rate:.1f}/h)")
+        budget_score = breakdown.budget_efficiency_score
+        if budget_score >= 8.0:
+            budget_label = "预算优秀"
+        elif budget_score >= 6.0:
+            budget_label = "预算合理"
         else:
-            reasons.append(f"预算偏低 (${breakdown.hourly_rate:.1f}/h)")
+            budget_label = "预算偏低"
 
-        if breakdown.clarity_score >= 7.0:
-            reasons.append("需求清晰")
-        elif breakdown.clarity_score <= 4.0:
-            reasons.append("需求较模糊")
+        clarity_score = breakdown.clarity_score
+        if clarity_score >= 7.0:
+            clarity_part = "，需求清晰"
+        elif clarity_score <= 4.0:
+            clarity_part = "，需求较模糊"
+        else:
+            clarity_part = ""
+
+        tech_part = "，技术高度匹配" if breakdown.tech_score >= 7.0 else ""
 
-        if breakdown.tech_score >= 7.0:
-            reasons.append("技术高度匹配")
-        return "，".join(reasons) + "。"
+        # 单次格式化拼出完整理由
+        return f"{budget_label} (${breakdown.hourly_rate:.1f}/h){clarity_part}{tech_part}。"
+
+    def _new_batch(self) -> _ScoringBatch:
+        """Create the shared state for one scoring batch."""
+        return _ScoringBatch()
 
     def score_project(
         self, project: Dict[str, Any], client_risk_score: Optional[int] = None,
         competition_analysis: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[int] = None,
     ) -> ProjectScore:
         """
         Calculate complete score for a project (10-point scale).
@@ -744,10 +1019,120 @@ class ProjectScorer:
             project: Project data
             client_risk_score: Optional risk score (0-100, higher is riskier) from client_risk service
             competition_analysis: Optional real competitor bid analysis from competitor_bid_service
+            cache_ttl: Result cache TTL in seconds for this call; None uses
+                ScoringConfig.result_cache_ttl (disabled by default). Re-score
+                paths pass RESCORE_RESULT_CACHE_TTL.
+        """
+        return self._score_project(
+            project,
+            client_risk_score,
+            competition_analysis,
+            self._new_batch(),
+            self._result_cache_ttl if cache_ttl is None else cache_ttl,
+        )
+
+    def score_projects(
+        self,
+        projects: List[Dict[str, Any]],
+        client_risk_scores: Optional[List[Optional[int]]] = None,
+        competition_analyses: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[ProjectScore]:
+        """
+        Score a batch of projects, sharing per-batch state (currency rates and
+        a single wall-clock snapshot for the 24h recency bonus).
+
+        Args:
+            projects: Project data list
+            client_risk_scores: Optional per-project risk scores, aligned with projects
+            competition_analyses: Optional per-project competition analyses, aligned with projects
+
+        Returns:
+            ProjectScore list in the same order as projects
+        """
+        batch = self._new_batch()
+        count = len(projects)
+        risk_scores = client_risk_scores or [None] * count
+        analyses = competition_analyses or [None] * count
+        return [
+            self._score_project(project, risk_score, analysis, batch, self._result_cache_ttl)
+            for project, risk_score, analysis in zip(projects, risk_scores, analyses)
+        ]
+
+    def _score_project(
+        self,
+        project: Dict[str, Any],
+        client_risk_score: Optional[int],
+        competition_analysis: Optional[Dict[str, Any]],
+        batch: _ScoringBatch,
+        cache_ttl: int,
+    ) -> ProjectScore:
+        """Score one project against the shared batch state."""
+        cache_key = None
+        if cache_ttl > 0:
+            cache_key = self._result_cache_key(
+                project, client_risk_score, competition_analysis, batch
+            )
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._compute_project_score(
+            project, client_risk_score, competition_analysis, batch
+        )
+        if cache_key is not None:
+            self._result_cache.set(cache_key, result, cache_ttl)
+        return result
+
+    def _result_cache_key(
+        self,
+        project: Dict[str, Any],
+        client_risk_score: Optional[int],
+        competition_analysis: Optional[Dict[str, Any]],
+        batch: _ScoringBatch,
+    ) -> Optional[str]:
+        """
+        Content hash of every input that influences the score (None if unhashable).
+
+        The 24h recency bonus depends on the clock, so the key includes whether
+        the project is still inside the freshness window; the currency rates
+        version is included so a converter refresh invalidates cached scores.
         """
-        estimated_hours = self.estimate_project_hours(project)
+        try:
+            payload = json.dumps(
+                [
+                    project,
+                    client_risk_score,
+                    competition_analysis,
+                    self._effective_weights,
+                    self._risk_penalty_multiplier,
+                    self._is_recent(project, batch.recent_threshold),
+                    rates_version(),
+                ],
+                sort_keys=True,
+                default=str,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """评分结果缓存统计（命中/未命中/大小）。"""
+        return self._result_cache.stats()
+
+    def _compute_project_score(
+        self,
+        project: Dict[str, Any],
+        client_risk_score: Optional[int],
+        competition_analysis: Optional[Dict[str, Any]],
+        batch: _ScoringBatch,
+    ) -> ProjectScore:
+        """Run the full scoring pipeline for one project (no caching)."""
+        text = _ProjectText.from_project(project)
+        owner = _OwnerSnapshot.from_project(project)
+        estimated_hours = self.estimate_project_hours(project, text)
         budget_efficiency_score, hourly_rate = self.score_budget_efficiency(
-            project, estimated_hours
+            project, estimated_hours, batch.rates
         )
 
         # Risk score mapping (REF-006)
@@ -756,35 +1141,32 @@ class ProjectScorer:
             # 100 risk -> 0 score, 0 risk -> 10 score
             base_risk_score = (100.0 - float(client_risk_score)) / 10.0
         else:
-            base_risk_score = self.score_risk(project)
+            base_risk_score = self.score_risk(project, owner)
 
         breakdown = ScoreBreakdown(
             budget_efficiency_score=budget_efficiency_score,
             estimated_hours=estimated_hours,
             hourly_rate=hourly_rate,
-            competition_score=self.score_competition(project, competition_analysis),
-            clarity_score=self.score_requirement_quality(project),
-            customer_score=self.score_customer(project),
-            tech_score=self.score_tech_match(project),
+            competition_score=self.score_competition(
+                project, competition_analysis, batch.recent_threshold
+            ),
+            clarity_score=self.score_requirement_quality(project, text),
+            customer_score=self.score_customer(project, owner),
+            tech_score=self.score_tech_match(project, text),
             risk_score=base_risk_score,
         )
 
-        # Use weights from settings.scoring_rules or defaults
-        rules = settings.scoring_rules
-        weights = rules.get("weights", self.weights)
-
         # 使用配置中的权重计算总分
         total = 0.0
-        for dimension, weight in weights.items():
-            dimension_score = getattr(breakdown, f"{dimension}_score", None)
-            if dimension_score is not None:
-                total += dimension_score * weight
+        for attr, weight in self._weighted_attrs:
+            total += getattr(breakdown, attr) * weight
 
         # ARC-001 / REF-006: High risk penalty (>60 risk score)
         if client_risk_score is not None and client_risk_score > 60:
-            penalty_multiplier = rules.get("risk", {}).get("penalty_multiplier", 0.5)
+            penalty_multiplier = self._risk_penalty_multiplier
             logger.warning(
-                f"Project {project.get('id')} has high risk score {client_risk_score}, applying penalty multiplier {penalty_multiplier}"
+                "Project %s has high risk score %s, applying penalty multiplier %s",
+                project.get('id'), client_risk_score, penalty_multiplier,
             )
             total *= penalty_multiplier
 
@@ -805,7 +1187,6 @@ class ProjectScorer:
 # 单例管理（保留便捷访问，但支持依赖注入）
 # ============================================================================
 
-_scorer: Optional["ProjectScorer"] = None
 _scorer_config: Optional[ScoringConfig] = None
 
 
@@ -825,9 +1206,9 @@ def reset_singleton() -> None:
         def tearDown(self):
             reset_singleton()
     """
-    global _scorer, _scorer_config
-    _scorer = None
+    global _scorer_config
     _scorer_config = None
+    _build_scorer.cache_clear()
     logger.debug("Project scorer singleton reset")
 
 
@@ -860,6 +1241,12 @@ def create_project_scorer(config: Optional[ScoringConfig] = None) -> "ProjectSco
     return ProjectScorer(config=config)
 
 
+@functools.lru_cache(maxsize=1)
+def _build_scorer() -> "ProjectScorer":
+    """按当前 _scorer_config 构建单例（lru_cache 缓存，配置变更时 cache_clear）。"""
+    return create_project_scorer(_scorer_config)
+
+
 def get_project_scorer() -> "ProjectScorer":
     """
     获取或创建单例评分器（便捷访问）。
@@ -878,11 +1265,7 @@ def get_project_scorer() -> "ProjectScorer":
         scorer = get_project_scorer()
         score = scorer.score_project(project)
     """
-    global _scorer, _scorer_config
-    if _scorer is None:
-        config = _scorer_config
-        _scorer = create_project_scorer(config)
-    return _scorer
+    return _build_scorer()
 
 
 def configure_scorer(config: ScoringConfig) -> None:
@@ -912,5 +1295,5 @@ def configure_scorer(config: ScoringConfig) -> None:
     """
     global _scorer_config
     _scorer_config = config
-    _scorer = None  # 标记需要重建
+    _build_scorer.cache_clear()  # 下次获取时按新配置重建
     logger.info("Project scorer configured with custom settings")
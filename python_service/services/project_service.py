@@ -1,12 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
-from typing import List, Optional, Dict, Any
+from sqlalchemy import or_
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import functools
 import logging
 import json
 import asyncio
 
-from database.models import Project
+from database.connection import get_db_session
+from database.models import Project, PROJECT_DICT_COLUMNS, project_to_dict
 from services.freelancer_client import get_freelancer_client, FreelancerAPIError
 from freelancersdk.resources.projects.helpers import (
     create_get_projects_project_details_object,
@@ -14,52 +16,102 @@ from freelancersdk.resources.projects.helpers import (
 )
 from config import settings
 from utils.currency_converter import get_currency_converter
+from utils import json_codec
+from utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
-_BIDDABLE_STATUSES = {"open", "active", "open_for_bidding"}
-_STICKY_LOCAL_STATUSES = {
+_BIDDABLE_STATUSES = frozenset({"open", "active", "open_for_bidding"})
+_STICKY_LOCAL_STATUSES = frozenset({
     "bid_submitted",
     "skills_blocked",
     "preferred_only",
     "escrow_required",
-}
+})
 
 
-def _check_skill_match(project_dict: Dict[str, Any]) -> bool:
+def _skill_keywords(mappings: Dict[int, List[str]]) -> Tuple[str, ...]:
+    """展开 RESUME_SKILL_MAPPINGS 中的全部简历技能关键词（小写）。"""
+    return tuple(
+        keyword.lower()
+        for keywords in mappings.values()
+        for keyword in keywords
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_skill_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher({"skills": keywords})
+
+
+# (RESUME_SKILL_MAPPINGS 对象, 对应的匹配器)：映射对象不变时无需重新展开关键词
+_skill_matcher_cache: Optional[Tuple[Dict[int, List[str]], KeywordMatcher]] = None
+
+
+def _get_skill_matcher() -> KeywordMatcher:
+    """
+    获取简历技能关键词匹配器。
+
+    按映射对象身份缓存：同一配置对象只展开一次关键词；
+    RESUME_SKILL_MAPPINGS 被替换后重新展开，关键词相同则复用已编译的匹配器。
+    """
+    global _skill_matcher_cache
+    mappings = settings.RESUME_SKILL_MAPPINGS
+    cached = _skill_matcher_cache
+    if cached is not None and cached[0] is mappings:
+        return cached[1]
+    matcher = _build_skill_matcher(_skill_keywords(mappings))
+    _skill_matcher_cache = (mappings, matcher)
+    return matcher
+
+
+def _check_skill_match(
+    project_dict: Dict[str, Any],
+    matcher: Optional[KeywordMatcher] = None,
+) -> bool:
     """
     检查项目是否与简历核心技能匹配
 
     Args:
         project_dict: 项目数据字典
+        matcher: 预编译的技能关键词匹配器（批量筛选时由调用方传入）
 
     Returns:
         bool: 是否匹配简历技能
     """
     # 获取项目的标题、描述和技能列表
-    title = (project_dict.get('title') or '').lower()
-    description = (project_dict.get('preview_description') or project_dict.get('description') or '').lower()
-    project_jobs = project_dict.get('jobs', [])
+    title = project_dict.get('title') or ''
+    description = project_dict.get('preview_description') or project_dict.get('description') or ''
+    return _match_skill_text(
+        f"{title} {description}".lower(),
+        project_dict.get('jobs', []),
+        matcher,
+    )
+
 
-    # 收集所有简历技能关键词
-    all_keywords = []
-    for keywords in settings.RESUME_SKILL_MAPPINGS.values():
-        all_keywords.extend(keywords)
+def _match_skill_text(
+    text_lower: str,
+    project_jobs: Optional[List[Any]],
+    matcher: Optional[KeywordMatcher] = None,
+) -> bool:
+    """
+    按已小写的"标题 描述"文本与技能列表匹配简历关键词。
 
-    # 检查标题和描述中是否包含简历关键词
-    text_content = f"{title} {description}"
-    text_match = any(keyword in text_content for keyword in all_keywords)
+    Args:
+        text_lower: 小写后的 "标题 描述" 文本
+        project_jobs: 项目技能列表（技能ID或技能名称）
+        matcher: 预编译的技能关键词匹配器
+    """
+    if matcher is None:
+        matcher = _get_skill_matcher()
 
-    # 如果文本匹配成功，直接返回
-    if text_match:
+    # 检查标题和描述中是否包含简历关键词（单次扫描）
+    if matcher.contains_any(text_lower):
         return True
 
     # 检查技能ID匹配（如果有技能ID数据）
     # 注意：Freelancer API返回的jobs可能是技能ID或技能名称
     if project_jobs:
-        for job in project_jobs:
-            job_str = str(job).lower()
-            if any(keyword in job_str for keyword in all_keywords):
-                return True
+        return any(matcher.contains_any(str(job).lower()) for job in project_jobs)
 
     return False
 
@@ -98,6 +150,17 @@ def _pre_filter_projects(
         'kept': 0
     }
 
+    # 循环不变量只准备一次
+    allowed_lower = (
+        frozenset(s.lower() for s in allowed_statuses)
+        if allowed_statuses is not None
+        else None
+    )
+    skill_matcher = _get_skill_matcher() if enable_skill_match else None
+
+    # 第一轮：按开销从低到高执行纯内存筛选
+    # （计费类型 -> 状态 -> 描述长度 -> 发布时间 -> 技能匹配）
+    candidates = []
     for project in projects_data:
         # 0.5 计费类型筛选（默认只保留 fixed 一次性项目）
         if fixed_price_only:
@@ -107,7 +170,29 @@ def _pre_filter_projects(
                 logger.debug("Filtered by billing type: %s (type=%s)", project.get("title"), project_type)
                 continue
 
-        # 0. 发布时间筛选（只保留最近项目）
+        # 1. 状态筛选
+        if allowed_lower is not None:
+            status = project.get('status', '').lower()
+            if status not in allowed_lower:
+                stats['filtered_status'] += 1
+                logger.debug("Filtered by status: %s (status: %s)", project.get('title'), status)
+                continue
+
+        # 标题/描述每个项目只取一次，供描述长度与技能匹配共用
+        title = project.get('title') or ''
+        description = project.get('preview_description') or project.get('description') or ''
+
+        # 2. 描述长度筛选
+        if min_desc_length is not None:
+            if len(description) < min_desc_length:
+                stats['filtered_desc'] += 1
+                logger.debug(
+                    "Filtered by description length: %s (length: %d < %s)",
+                    project.get('title'), len(description), min_desc_length,
+                )
+                continue
+
+        # 3. 发布时间筛选（只保留最近项目）
         if min_submit_ts is not None:
             submit_ts = _parse_submit_timestamp(project.get("submitdate"))
             if submit_ts is None or submit_ts < min_submit_ts:
@@ -115,92 +200,146 @@ def _pre_filter_projects(
                 logger.debug("Filtered by submitdate: %s", project.get('title'))
                 continue
 
-        # 1. 预算筛选
-        if budget_min_threshold is not None:
-            budget_info = project.get('budget', {})
-            budget_max = budget_info.get('maximum') or budget_info.get('minimum', 0)
-            currency_code = project.get('currency', {}).get('code', 'USD')
-            
-            # 使用动态汇率转换
-            converter = get_currency_converter()
-            currency_rate = converter.get_rate_sync(currency_code)
+        # 4. 技能匹配筛选
+        if enable_skill_match:
+            skill_text = f"{title} {description}".lower()
+            if not _match_skill_text(skill_text, project.get('jobs', []), skill_matcher):
+                stats['filtered_skill'] += 1
+                logger.debug("Filtered by skill mismatch: %s", project.get('title'))
+                continue
+
+        candidates.append(project)
+
+    # 第二轮：预算筛选放在最后，只为通过前面筛选的项目查询汇率
+    if budget_min_threshold is not None and candidates:
+        # 货币代码每个项目只取一次；去重后一次性取回全部汇率
+        currency_codes = [
+            project.get('currency', {}).get('code', 'USD') for project in candidates
+        ]
+        currency_rates = get_currency_converter().get_rates_sync(currency_codes)
+        # 缺失汇率按货币记录一次告警（而不是每个项目一次）
+        for currency_code, currency_rate in currency_rates.items():
             if currency_rate is None:
                 logger.warning(
                     "Currency rate missing for %s; skipping budget filter",
                     currency_code,
                 )
-                budget_usd = None
-            else:
+
+        for project, currency_code in zip(candidates, currency_codes):
+            currency_rate = currency_rates[currency_code]
+            if currency_rate is not None:
+                budget_info = project.get('budget', {})
+                budget_max = budget_info.get('maximum') or budget_info.get('minimum', 0)
+                # 使用动态汇率转换
                 budget_usd = budget_max * currency_rate
+                if budget_usd < budget_min_threshold:
+                    stats['filtered_budget'] += 1
+                    logger.debug(
+                        "Filtered by budget: %s (budget: %.2f USD < %s)",
+                        project.get('title'), budget_usd, budget_min_threshold,
+                    )
+                    continue
 
-            if budget_usd is not None and budget_usd < budget_min_threshold:
-                stats['filtered_budget'] += 1
-                logger.debug(f"Filtered by budget: {project.get('title')} (budget: {budget_usd:.2f} USD < {budget_min_threshold})")
-                continue
+            filtered.append(project)
+    else:
+        filtered = candidates
 
-        # 2. 描述长度筛选
-        if min_desc_length is not None:
-            description = project.get('preview_description') or project.get('description') or ''
-            if len(description) < min_desc_length:
-                stats['filtered_desc'] += 1
-                logger.debug(f"Filtered by description length: {project.get('title')} (length: {len(description)} < {min_desc_length})")
-                continue
+    # 通过所有筛选条件
+    stats['kept'] = len(filtered)
 
-        # 3. 状态筛选
-        if allowed_statuses is not None:
-            status = project.get('status', '').lower()
-            if status not in [s.lower() for s in allowed_statuses]:
-                stats['filtered_status'] += 1
-                logger.debug(f"Filtered by status: {project.get('title')} (status: {status})")
-                continue
+    logger.info("Pre-filter results: %s", stats)
+    return filtered, stats
 
-        # 4. 技能匹配筛选
-        if enable_skill_match:
-            if not _check_skill_match(project):
-                stats['filtered_skill'] += 1
-                logger.debug(f"Filtered by skill mismatch: {project.get('title')}")
-                continue
 
-        # 通过所有筛选条件
-        filtered.append(project)
-        stats['kept'] += 1
+# 同步时由 API 数据覆盖的字段
+_SYNC_FIELDS = (
+    "title",
+    "preview_description",
+    "description",
+    "budget_minimum",
+    "budget_maximum",
+    "currency_code",
+    "status",
+    "type_id",
+    "owner_id",
+    "submitdate",
+)
 
-    logger.info(f"Pre-filter results: {stats}")
-    return filtered, stats
+
+# 仅在部分 payload 中出现的字段；新行统一补 None，保证 executemany 各行键一致
+_NEW_ROW_OPTIONAL_FIELDS = {"type_id": None, "submitdate": None, "skills": None}
 
 
-def _apply_project_fields(project: Project, project_dict: Dict[str, Any]) -> None:
+def _project_field_values(
+    project_dict: Dict[str, Any],
+    current: Dict[str, Any],
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
     """
-    Apply mutable fields from API payload to local Project row.
+    Compute mutable field values from API payload.
+
+    Args:
+        project_dict: API payload
+        current: Current field values of the local row ({} for a new row)
+        now: Batch timestamp for updated_at (defaults to datetime.utcnow())
+
+    Returns:
+        Column -> value mapping; fields the payload does not set are omitted.
     """
+    get_current = current.get
     budget = project_dict.get("budget", {}) or {}
     currency = project_dict.get("currency", {}) or {}
 
-    project.title = project_dict.get("title", project.title or "")
-    project.preview_description = project_dict.get(
-        "preview_description", project.preview_description
-    )
-    project.description = project_dict.get("description", project.description)
-    project.budget_minimum = budget.get("minimum", project.budget_minimum)
-    project.budget_maximum = budget.get("maximum", project.budget_maximum)
-    project.currency_code = currency.get("code", project.currency_code or "USD")
-    remote_status = str(project_dict.get("status", project.status or "open")).lower()
-    current_status = str(project.status or "").lower()
+    values = {
+        "title": project_dict.get("title", get_current("title") or ""),
+        "preview_description": project_dict.get(
+            "preview_description", get_current("preview_description")
+        ),
+        "description": project_dict.get("description", get_current("description")),
+        "budget_minimum": budget.get("minimum", get_current("budget_minimum")),
+        "budget_maximum": budget.get("maximum", get_current("budget_maximum")),
+        "currency_code": currency.get("code", get_current("currency_code") or "USD"),
+    }
+    remote_status = str(project_dict.get("status", get_current("status") or "open")).lower()
+    current_status = str(get_current("status") or "").lower()
     if current_status in _STICKY_LOCAL_STATUSES and remote_status in _BIDDABLE_STATUSES:
         # Keep local terminal/blocked marker to avoid repeated attempts after periodic sync.
-        project.status = current_status
+        values["status"] = current_status
     else:
-        project.status = remote_status or "open"
+        values["status"] = remote_status or "open"
     project_type = str(project_dict.get("type") or "").lower()
     if project_type == "fixed":
-        project.type_id = 1
+        values["type_id"] = 1
     elif project_type == "hourly":
-        project.type_id = 2
-    project.owner_id = project_dict.get("owner_id", project.owner_id)
+        values["type_id"] = 2
+    values["owner_id"] = project_dict.get("owner_id", get_current("owner_id"))
     submitdate = project_dict.get("submitdate")
     if submitdate is not None:
-        project.submitdate = str(submitdate)
-    project.updated_at = datetime.utcnow()
+        values["submitdate"] = str(submitdate)
+    jobs = project_dict.get("jobs")
+    if jobs:
+        # 只保存技能 ID 列表（JSON），读取方可直接 json.loads
+        values["skills"] = json_codec.dumps(
+            [job.get("id") if isinstance(job, dict) else job for job in jobs]
+        )
+    values["updated_at"] = now or datetime.utcnow()
+    return values
+
+
+def _apply_project_fields(
+    project: Project, project_dict: Dict[str, Any], now: Optional[datetime] = None
+) -> None:
+    """
+    Apply mutable fields from API payload to local Project row.
+    """
+    current = {name: getattr(project, name) for name in _SYNC_FIELDS}
+    for name, value in _project_field_values(project_dict, current, now).items():
+        setattr(project, name, value)
+
+
+def _normalize_status(status: Any) -> Any:
+    """项目状态统一小写存储（与 search_projects 的 status IN 查询保持一致）。"""
+    return str(status).lower() if status else status
 
 
 def _parse_submit_timestamp(raw_submitdate: Any) -> Optional[int]:
@@ -215,8 +354,14 @@ def _parse_submit_timestamp(raw_submitdate: Any) -> Optional[int]:
             ts //= 1000
         return ts if ts > 0 else None
 
-    # string forms
-    raw = str(raw_submitdate).strip()
+    # string forms（分页重复抓取时同一 submitdate 常反复出现，解析结果按字符串缓存）
+    return _parse_submit_timestamp_str(str(raw_submitdate))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_submit_timestamp_str(raw_submitdate: str) -> Optional[int]:
+    """String branch of _parse_submit_timestamp (memoized)."""
+    raw = raw_submitdate.strip()
     if not raw:
         return None
 
@@ -272,8 +417,6 @@ async def search_projects(
             logger.info("Sync already in progress, skipping duplicate request")
             return []
 
-        from database.connection import get_db_session
-
         async with _sync_lock:
             global _is_syncing
             _is_syncing = True
@@ -301,20 +444,43 @@ async def search_projects(
                     )
 
                     with get_db_session() as background_db:
+                        # 一次查询取回本批中已入库的项目，循环内按 ID 取用（避免 N+1）
+                        candidate_ids = [p['id'] for p in filtered_projects if p.get('id')]
+                        projects_by_id: Dict[int, Project] = {
+                            row.freelancer_id: row
+                            for row in background_db.query(Project)
+                            .filter(Project.freelancer_id.in_(candidate_ids))
+                            .all()
+                        } if candidate_ids else {}
+                        # 新项目以字典形式收集，Core executemany 批量插入（绕过 ORM 工作单元）
+                        new_rows: Dict[int, Dict[str, Any]] = {}
+                        # 整批共用同一时间戳
+                        now = datetime.utcnow()
+
                         for project_dict in filtered_projects:
                             pid = project_dict.get('id')
                             if not pid: continue
 
-                            existing = background_db.query(Project).filter_by(freelancer_id=pid).first()
+                            existing = projects_by_id.get(pid)
                             if existing:
-                                _apply_project_fields(existing, project_dict)
-                            else:
-                                new_proj = Project(
-                                    freelancer_id=pid,
-                                    created_at=datetime.utcnow()
-                                )
-                                _apply_project_fields(new_proj, project_dict)
-                                background_db.add(new_proj)
+                                _apply_project_fields(existing, project_dict, now)
+                                continue
+
+                            row = new_rows.get(pid)
+                            if row is None:
+                                # 同批次内重复出现的新项目合并为同一行
+                                row = new_rows[pid] = {
+                                    **_NEW_ROW_OPTIONAL_FIELDS,
+                                    "freelancer_id": pid,
+                                    "created_at": now,
+                                }
+                            row.update(_project_field_values(project_dict, row, now))
+                        if new_rows:
+                            # OR IGNORE：并发同步已插入同一 freelancer_id 时跳过，而不是让整批失败
+                            background_db.execute(
+                                Project.__table__.insert().prefix_with("OR IGNORE", dialect="sqlite"),
+                                list(new_rows.values()),
+                            )
                         background_db.commit()
                 logger.info(f"Background sync completed successfully for query: {query}")
             except Exception as e:
@@ -335,7 +501,8 @@ async def search_projects(
     if status:
         db_query = db_query.filter(Project.status == status)
     elif normalized_allowed_statuses:
-        db_query = db_query.filter(func.lower(Project.status).in_(normalized_allowed_statuses))
+        # 状态在写入时已统一小写，直接 IN 以命中 status 索引
+        db_query = db_query.filter(Project.status.in_(normalized_allowed_statuses))
 
     if fixed_price_only:
         db_query = db_query.filter(Project.type_id == 1)
@@ -362,9 +529,10 @@ async def search_projects(
 
     # 排序和分页
     db_query = db_query.order_by(Project.created_at.desc())
-    db_projects = db_query.offset(offset).limit(limit).all()
+    # 只选取输出所需的列，直接由行构建字典（跳过 ORM 实例化）
+    rows = db_query.with_entities(*PROJECT_DICT_COLUMNS).offset(offset).limit(limit).all()
 
-    return [p.to_dict() for p in db_projects]
+    return [project_to_dict(row) for row in rows]
 
 async def get_project_details(db: Session, project_id: int) -> Dict[str, Any]:
     """
@@ -392,7 +560,7 @@ async def get_project_details(db: Session, project_id: int) -> Dict[str, Any]:
         # Update existing record
         project.title = project_data.get('title', project.title)
         project.description = project_data.get('description', project.description)
-        project.status = project_data.get('status', project.status)
+        project.status = _normalize_status(project_data.get('status', project.status))
         project.updated_at = datetime.utcnow()
 
         if 'full_description' in project_data:
@@ -408,7 +576,7 @@ async def get_project_details(db: Session, project_id: int) -> Dict[str, Any]:
             budget_maximum=project_data.get('budget', {}).get('maximum'),
             currency_code=project_data.get('currency', {}).get('code', 'USD'),
             submitdate=project_data.get('submitdate'),
-            status=project_data.get('status', 'open'),
+            status=_normalize_status(project_data.get('status', 'open')),
             type_id=project_data.get('type_id'),
             owner_id=project_data.get('owner_id'),
             country=project_data.get('country', {}).get('name')
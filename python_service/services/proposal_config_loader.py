@@ -6,6 +6,9 @@ from 'bid_prompts.yaml'. Ensures version compatibility and provides access metho
 for personas, styles, structures, and validation rules.
 """
 
+import copy
+import functools
+import mmap
 import yaml
 import logging
 import os
@@ -14,6 +17,17 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C parser; fall back to the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+    logger.warning(
+        "libyaml not available; proposal config uses the pure-Python YAML parser. "
+        "Install libyaml-dev and reinstall PyYAML for faster loading."
+    )
+
 
 # Expected schema for configuration
 REQUIRED_SCHEMA_KEYS = [
@@ -28,6 +42,38 @@ OPTIONAL_SCHEMA_KEYS = [
     "system_prompts",
 ]
 
+_VALID_KEYS = frozenset(REQUIRED_SCHEMA_KEYS + OPTIONAL_SCHEMA_KEYS)
+
+_VALID_PERSONA_KEYS = frozenset({"name", "hints", "system_prompt", "examples"})
+
+_VALID_RULE_KEYS = frozenset({
+    "min_words",
+    "max_words",
+    "prohibited_phrases",
+    "prohibited_headers",
+    "required_elements",
+    "keywords_threshold",
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML config file, cached by (path, mtime_ns, size).
+
+    Unchanged files are parsed only once; editing the file changes its
+    mtime/size and therefore the cache key. The returned object is the
+    shared cached value: callers must not mutate it (load_config hands out
+    a deep copy).
+    """
+    if size == 0:
+        # 空文件无法 mmap；与 yaml 解析空文档的结果一致
+        return None
+    # 只读映射文件，解析器直接读取映射区域，由内核顺序预读
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        config = yaml.load(mm, Loader=_YamlLoader)
+    return config
+
 
 class ProposalConfigLoader:
     """
@@ -58,17 +104,19 @@ class ProposalConfigLoader:
             return False
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            stat = os.stat(config_path)
+            # 深拷贝：缓存中的解析结果为共享对象，修改配置不能影响后续加载
+            config = copy.deepcopy(
+                _parse_config_file(
+                    os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+                )
+            )
 
             if not config:
                 logger.error("Config file is empty")
                 return False
 
-            if not cls._validate_version(config):
-                logger.error(
-                    f"Invalid config version. Expected 2.0, got {config.get('version')}"
-                )
+            if not cls.validate_schema(config):
                 return False
 
             cls._config = config
@@ -80,9 +128,11 @@ class ProposalConfigLoader:
             return False
 
     @classmethod
-    def _validate_version(cls, config: Dict[str, Any]) -> bool:
-        """Validate that the configuration version is 2.0."""
-        return str(config.get("version", "")) == "2.0"
+    def reset(cls) -> None:
+        """Drop the loaded configuration and the parsed-file cache."""
+        _parse_config_file.cache_clear()
+        cls._config = {}
+        cls._loaded = False
 
     @classmethod
     def validate_schema(cls, config: Dict[str, Any]) -> bool:
@@ -97,33 +147,27 @@ class ProposalConfigLoader:
         Returns:
             bool: True if config matches expected schema, False otherwise.
         """
-        # Check for required keys
-        for key in REQUIRED_SCHEMA_KEYS:
-            if key not in config:
-                logger.error(f"Missing required config key: {key}")
-                return False
-
-        # Validate version
-        version = config.get("version", "")
-        if str(version) != "2.0":
-            logger.error(f"Invalid config version: {version}. Expected 2.0")
-            return False
-
-        # Check for unknown keys (optional keys are allowed, but warn about completely unexpected ones)
-        valid_keys = set(REQUIRED_SCHEMA_KEYS + OPTIONAL_SCHEMA_KEYS)
-        for key in config.keys():
-            if key not in valid_keys:
+        # 单次遍历：版本校验、子结构校验与未知 key 告警合并在同一个循环中
+        has_version = False
+        for key, value in config.items():
+            if key == "version":
+                if str(value) != "2.0":
+                    logger.error(f"Invalid config version: {value}. Expected 2.0")
+                    return False
+                has_version = True
+            elif key == "personas":
+                if not cls._validate_personas(value):
+                    return False
+            elif key == "validation_rules":
+                if not cls._validate_validation_rules(value):
+                    return False
+            elif key not in _VALID_KEYS:
+                # Optional keys are allowed, but warn about completely unexpected ones
                 logger.warning(f"Unknown config key: {key}")
 
-        # Validate personas structure if present
-        if "personas" in config:
-            if not cls._validate_personas(config["personas"]):
-                return False
-
-        # Validate validation_rules structure if present
-        if "validation_rules" in config:
-            if not cls._validate_validation_rules(config["validation_rules"]):
-                return False
+        if not has_version:
+            logger.error("Missing required config key: version")
+            return False
 
         return True
 
@@ -134,15 +178,16 @@ class ProposalConfigLoader:
             logger.error("Personas must be a dictionary")
             return False
 
-        valid_persona_keys = {"name", "hints", "system_prompt", "examples"}
         for persona_name, persona_data in personas.items():
             if not isinstance(persona_data, dict):
                 logger.error(f"Persona '{persona_name}' must be a dictionary")
                 return False
 
-            for key in persona_data.keys():
-                if key not in valid_persona_keys:
-                    logger.warning(f"Unknown key '{key}' in persona '{persona_name}'")
+            # 集合差集快速判断；有未知 key 时再按原顺序告警
+            if persona_data.keys() - _VALID_PERSONA_KEYS:
+                for key in persona_data:
+                    if key not in _VALID_PERSONA_KEYS:
+                        logger.warning(f"Unknown key '{key}' in persona '{persona_name}'")
 
         return True
 
@@ -153,17 +198,10 @@ class ProposalConfigLoader:
             logger.error("validation_rules must be a dictionary")
             return False
 
-        valid_rule_keys = {
-            "min_words",
-            "max_words",
-            "prohibited_phrases",
-            "prohibited_headers",
-            "required_elements",
-            "keywords_threshold",
-        }
-        for key in rules.keys():
-            if key not in valid_rule_keys:
-                logger.warning(f"Unknown validation rule key: {key}")
+        if rules.keys() - _VALID_RULE_KEYS:
+            for key in rules:
+                if key not in _VALID_RULE_KEYS:
+                    logger.warning(f"Unknown validation rule key: {key}")
 
         return True
 
@@ -4,17 +4,28 @@ Proposal Metrics Collection Module
 Tracks and analyzes proposal generation quality metrics.
 """
 
+import atexit
 import json
+import os
+import re
+import threading
 import time
 import logging
-from dataclasses import dataclass, field, asdict
+import operator
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from utils import json_codec
+
 logger = logging.getLogger(__name__)
 
+# 校验问题中标记"违禁短语"的关键字（大小写不敏感）
+_FORBIDDEN_RE = re.compile(r"forbidden|prohibited", re.IGNORECASE)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProposalMetrics:
     """
     Single proposal generation metrics
@@ -47,12 +58,32 @@ class ProposalMetrics:
     model_used: str = "unknown"
     timestamp: float = field(default_factory=time.time)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization
+
+        Fields are aliased rather than deep-copied like asdict(); pass
+        copy=True when the caller intends to mutate validation_issues.
+        """
+        return {
+            "proposal_id": self.proposal_id,
+            "project_id": self.project_id,
+            "proposal_length": self.proposal_length,
+            "word_count": self.word_count,
+            "has_question": self.has_question,
+            "has_markdown_headers": self.has_markdown_headers,
+            "forbidden_phrases_count": self.forbidden_phrases_count,
+            "validation_passed": self.validation_passed,
+            "validation_issues": (
+                list(self.validation_issues) if copy else self.validation_issues
+            ),
+            "generation_time_ms": self.generation_time_ms,
+            "model_used": self.model_used,
+            "timestamp": self.timestamp,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsSummary:
     """
     Summary statistics for collected metrics
@@ -82,25 +113,76 @@ class MetricsSummary:
         return asdict(self)
 
 
+# 按字段顺序取值，用位置参数构造 ProposalMetrics，避免逐条 **kwargs 展开
+_PROPOSAL_METRICS_FIELDS = tuple(f.name for f in fields(ProposalMetrics))
+_get_metrics_fields = operator.itemgetter(*_PROPOSAL_METRICS_FIELDS)
+
+
+def _metrics_from_record(record: Dict[str, Any]) -> ProposalMetrics:
+    """Build ProposalMetrics from a stored record (missing defaulted fields allowed)"""
+    try:
+        return ProposalMetrics(*_get_metrics_fields(record))
+    except KeyError:
+        return ProposalMetrics(**record)
+
+
 class ProposalMetricsCollector:
     """
     Collector for proposal generation metrics
 
     Tracks proposal quality over time and provides summary statistics.
+
+    除 ProposalMetrics 列表外，还在 record_proposal 时维护各字段的累计值，
+    get_average_metrics 只需做除法（O(1)），不随历史记录数增长。
     """
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    DEFAULT_FLUSH_EVERY = 16
+
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+    ):
         """
         Initialize the metrics collector
 
         Args:
-            storage_path: Path to persist metrics (optional)
+            storage_path: Path to persist metrics (optional, JSON Lines)
+            flush_every: Flush buffered records to disk every N records
         """
         self._metrics: List[ProposalMetrics] = []
+        self._reset_totals()
         self._storage_path = storage_path
+        self._storage_file = None
+        self._flush_every = max(1, flush_every)
+        self._pending_writes = 0
+        # 导出结果缓存；记录集合变化时置为 None
+        self._export_cache: Optional[str] = None
         if storage_path:
             self._load_from_storage()
 
+    def _reset_totals(self) -> None:
+        """Reset the running totals and the per-project index"""
+        self._sum_length = 0
+        self._sum_words = 0
+        self._count_question = 0
+        self._count_headers = 0
+        self._sum_issues = 0
+        self._count_passed = 0
+        self._sum_gen_ms = 0
+        self._by_project: Dict[int, List[ProposalMetrics]] = defaultdict(list)
+
+    def _add_to_totals(self, metrics: ProposalMetrics) -> None:
+        """Add one proposal to the running totals and the per-project index"""
+        self._sum_length += metrics.proposal_length
+        self._sum_words += metrics.word_count
+        self._count_question += bool(metrics.has_question)
+        self._count_headers += bool(metrics.has_markdown_headers)
+        self._sum_issues += len(metrics.validation_issues)
+        self._count_passed += bool(metrics.validation_passed)
+        self._sum_gen_ms += metrics.generation_time_ms
+        self._by_project[metrics.project_id].append(metrics)
+
     def record_proposal(
         self,
         proposal_id: str,
@@ -127,10 +209,10 @@ class ProposalMetricsCollector:
         # Calculate basic metrics
         word_count = len(proposal.split())
         has_question = "?" in proposal
-        has_markdown_headers = bool(
-            proposal.lstrip().startswith("#")
-            or "###" in proposal
-            or "##" in proposal
+        # 单字符查找（memchr）先排除不含 "#" 的常见情况；
+        # "##" 已涵盖 "###"，仅在未命中时再检查开头的 "#"
+        has_markdown_headers = "#" in proposal and (
+            "##" in proposal or proposal.lstrip().startswith("#")
         )
 
         # Extract validation info if provided
@@ -142,10 +224,8 @@ class ProposalMetricsCollector:
             validation_passed = validation_result.get("is_valid", True)
             validation_issues = validation_result.get("issues", [])
             # Count forbidden phrases from issues
-            forbidden_count = sum(
-                1 for issue in validation_issues
-                if "forbidden" in issue.lower() or "prohibited" in issue.lower()
-            )
+            search = _FORBIDDEN_RE.search
+            forbidden_count = sum(1 for issue in validation_issues if search(issue))
 
         metrics = ProposalMetrics(
             proposal_id=proposal_id,
@@ -162,11 +242,13 @@ class ProposalMetricsCollector:
         )
 
         self._metrics.append(metrics)
-        logger.info(f"Recorded metrics for proposal {proposal_id}")
+        self._add_to_totals(metrics)
+        self._export_cache = None
+        logger.info("Recorded metrics for proposal %s", proposal_id)
 
         # Persist if storage path is set
         if self._storage_path:
-            self._save_to_storage()
+            self._append_to_storage(metrics)
 
         return metrics
 
@@ -191,17 +273,13 @@ class ProposalMetricsCollector:
 
         total = len(self._metrics)
 
-        avg_length = sum(m.proposal_length for m in self._metrics) / total
-        avg_word_count = sum(m.word_count for m in self._metrics) / total
-        question_rate = sum(1 for m in self._metrics if m.has_question) / total * 100
-        markdown_header_rate = (
-            sum(1 for m in self._metrics if m.has_markdown_headers) / total * 100
-        )
-        avg_validation_issues = (
-            sum(len(m.validation_issues) for m in self._metrics) / total
-        )
-        pass_rate = sum(1 for m in self._metrics if m.validation_passed) / total * 100
-        avg_generation_time_ms = sum(m.generation_time_ms for m in self._metrics) / total
+        avg_length = self._sum_length / total
+        avg_word_count = self._sum_words / total
+        question_rate = self._count_question / total * 100
+        markdown_header_rate = self._count_headers / total * 100
+        avg_validation_issues = self._sum_issues / total
+        pass_rate = self._count_passed / total * 100
+        avg_generation_time_ms = self._sum_gen_ms / total
 
         return MetricsSummary(
             total_proposals=total,
@@ -223,14 +301,18 @@ class ProposalMetricsCollector:
 
         Returns:
             JSON string of all metrics
-        """
-        data = {
-            "metrics": [m.to_dict() for m in self._metrics],
-            "summary": self.get_average_metrics().to_dict(),
-            "exported_at": time.time(),
-        }
 
-        json_str = json.dumps(data, indent=2, default=str)
+        记录未变化时直接复用上次的序列化结果（exported_at 为该快照的生成时间）。
+        """
+        json_str = self._export_cache
+        if json_str is None:
+            # dataclass 直接交给编码器，无需逐条 asdict()
+            data = {
+                "metrics": self._metrics,
+                "summary": self.get_average_metrics(),
+                "exported_at": time.time(),
+            }
+            json_str = self._export_cache = json_codec.dumps_indented(data)
 
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -249,23 +331,65 @@ class ProposalMetricsCollector:
         Returns:
             List of ProposalMetrics for the project
         """
-        return [m for m in self._metrics if m.project_id == project_id]
+        matches = self._by_project.get(project_id)
+        return list(matches) if matches else []
 
     def clear_metrics(self) -> None:
         """Clear all collected metrics"""
         self._metrics.clear()
+        self._reset_totals()
+        self._export_cache = None
+        if self._storage_path:
+            self._rewrite_storage()
         logger.info("All metrics cleared")
 
-    def _save_to_storage(self) -> None:
-        """Persist metrics to storage file"""
+    def flush(self) -> None:
+        """Write buffered records to the storage file"""
+        if self._storage_file is not None:
+            self._storage_file.flush()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush and close the storage file handle"""
+        if self._storage_file is not None:
+            self._storage_file.close()
+            self._storage_file = None
+            atexit.unregister(self.close)
+        self._pending_writes = 0
+
+    def _append_to_storage(self, metrics: ProposalMetrics) -> None:
+        """
+        Append a single record to the storage file (JSON Lines)
+
+        文件句柄只打开一次并保持缓冲；每累计 flush_every 条记录落盘一次，
+        进程退出时由 atexit 兜底写出剩余记录。
+        """
         if not self._storage_path:
             return
 
+        if self._storage_file is None:
+            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+            self._storage_file = open(
+                self._storage_path, "a", encoding="utf-8", buffering=1 << 16
+            )
+            atexit.register(self.close)
+        self._storage_file.write(json_codec.dumps(metrics.to_dict()) + "\n")
+        self._pending_writes += 1
+        if self._pending_writes >= self._flush_every:
+            self.flush()
+
+    def _rewrite_storage(self) -> None:
+        """Compact the storage file to exactly the in-memory metrics"""
+        if not self._storage_path:
+            return
+
+        self.close()
         self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-        json_data = [m.to_dict() for m in self._metrics]
-        self._storage_path.write_text(
-            json.dumps(json_data, indent=2), encoding="utf-8"
-        )
+        tmp_path = self._storage_path.with_name(self._storage_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for m in self._metrics:
+                f.write(json_codec.dumps(m.to_dict()) + "\n")
+        os.replace(tmp_path, self._storage_path)
 
     def _load_from_storage(self) -> None:
         """Load metrics from storage file"""
@@ -273,15 +397,41 @@ class ProposalMetricsCollector:
             return
 
         try:
-            data = json.loads(self._storage_path.read_text(encoding="utf-8"))
-            self._metrics = [ProposalMetrics(**m) for m in data]
+            text = self._storage_path.read_text(encoding="utf-8")
+            legacy = text.lstrip().startswith("[")
+            skipped = 0
+            if legacy:
+                # 旧格式：整个文件为一个 JSON 数组
+                records = json.loads(text)
+            else:
+                records = []
+                for line_no, line in enumerate(text.splitlines(), 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # 例如进程中断导致的半行写入
+                        logger.warning(f"Skipping malformed metrics line {line_no}")
+                        skipped += 1
+
+            self._metrics = [_metrics_from_record(m) for m in records]
+            self._reset_totals()
+            for metrics in self._metrics:
+                self._add_to_totals(metrics)
             logger.info(f"Loaded {len(self._metrics)} metrics from storage")
+
+            # 旧格式需转换；存在坏行或文件未以换行结尾（崩溃留下的半行）时重写文件，
+            # 否则下一条追加记录会直接拼接在半行之后而在重启时一并丢失
+            if legacy or skipped or (text and not text.endswith("\n")):
+                self._rewrite_storage()
         except Exception as e:
             logger.warning(f"Failed to load metrics from storage: {e}")
 
 
 # Singleton instance
 _collector: Optional[ProposalMetricsCollector] = None
+_collector_lock = threading.Lock()
 
 
 def get_metrics_collector(
@@ -296,14 +446,27 @@ def get_metrics_collector(
     Returns:
         ProposalMetricsCollector singleton instance
     """
+    # 快路径：已初始化时只有一次全局读取，不加锁
+    collector = _collector
+    if collector is not None:
+        return collector
+    return _create_collector(storage_path)
+
+
+def _create_collector(storage_path: Optional[Path]) -> ProposalMetricsCollector:
+    """Create the singleton under the lock (double-checked)"""
     global _collector
-    if _collector is None:
-        _collector = ProposalMetricsCollector(storage_path=storage_path)
-    return _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = ProposalMetricsCollector(storage_path=storage_path)
+        return _collector
 
 
 def reset_collector() -> None:
     """Reset the singleton collector (for testing)"""
     global _collector
-    _collector = None
+    with _collector_lock:
+        if _collector is not None:
+            _collector.close()
+        _collector = None
     logger.debug("ProposalMetricsCollector singleton reset")
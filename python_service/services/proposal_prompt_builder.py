@@ -9,25 +9,34 @@ Proposal Prompt Builder - 标书提示词构建器
 - build_project_context(project, score_data): 构建项目上下文
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
+import functools
 import json
 import logging
+import sys
 from pathlib import Path
-from sqlalchemy.orm import Session
 from config import settings
+from utils.keyword_matcher import KeywordMatcher
+
+if TYPE_CHECKING:  # 仅用于类型注解，运行时不导入 SQLAlchemy
+    from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
-RESUME_GUIDE_PATH = (
-    Path(__file__).resolve().parents[2] / "docs" / "guides" / "个人简历-核心能力.md"
-)
-BID_REFERENCE_SAMPLES_PATH = (
-    Path(__file__).resolve().parents[1] / "config" / "bid_reference_samples.json"
-)
+
+# 数据文件路径在首次使用时才解析（Path.resolve 会访问文件系统）
+@functools.lru_cache(maxsize=1)
+def _resume_guide_path() -> Path:
+    return Path(__file__).resolve().parents[2] / "docs" / "guides" / "个人简历-核心能力.md"
+
+
+@functools.lru_cache(maxsize=1)
+def _bid_reference_samples_path() -> Path:
+    return Path(__file__).resolve().parents[1] / "config" / "bid_reference_samples.json"
 
 
 # 基础提示词（仅用于评分，不包含提案生成逻辑）
-BASE_SYSTEM_PROMPT = """You are an expert Freelancer project evaluator. Your goal is to identify
+BASE_SYSTEM_PROMPT = sys.intern("""You are an expert Freelancer project evaluator. Your goal is to identify
 projects with HIGH WIN RATE and COMPLETION RATE for a senior developer.
 
 PRIMARY GOAL: Maximize win rate and successful project completion, not just profit.
@@ -85,11 +94,11 @@ Return strict JSON only:
     "hourly_rate": 25.0,
     "risk_keywords": ["insights"]
 }
-"""
+""")
 
 
 # 叙事化风格指令（禁止列表，段落式）
-STYLE_NARRATIVE = """
+STYLE_NARRATIVE = sys.intern("""
 ## 风格要求：叙事化表达
 
 ### 必须遵守的规则：
@@ -102,11 +111,11 @@ STYLE_NARRATIVE = """
 - 使用过渡词连接上下文（"首先"、"此外"、"最后"、"因此"等）
 - 每个段落3-5个完整句子
 - 段落之间逻辑清晰，层层递进
-"""
+""")
 
 
 # 三段式结构（痛点→经验→问题）
-STRUCTURE_THREE_STEP = """
+STRUCTURE_THREE_STEP = sys.intern("""
 ## 结构要求：三段式提案
 
 ### 第一段：痛点共鸣
@@ -126,9 +135,214 @@ STRUCTURE_THREE_STEP = """
 - 询问客户最关心的1-2个问题
 - 自然引出报价讨论
 - 长度：80-120字
+""")
+
+
+# 提案提示词开头（固定）
+PROPOSAL_PROMPT_INTRO = (
+    "You are a senior freelance developer on Freelancer.com, known for winning "
+    "high-quality projects through personalized, technical, and persuasive proposals."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_bid_reference_samples() -> Tuple[Dict[str, Any], ...]:
+    """读取投标参考样例（进程内只解析一次，跨构建器实例共享）；失败返回空元组。"""
+    try:
+        payload = json.loads(_bid_reference_samples_path().read_text(encoding="utf-8"))
+        samples = payload.get("samples", [])
+        if isinstance(samples, list):
+            return tuple(item for item in samples if isinstance(item, dict))
+    except Exception:
+        pass
+    return ()
+
+
+@functools.lru_cache(maxsize=1)
+def _render_bid_reference_context() -> str:
+    """渲染投标参考段落（样例在进程内不变，渲染结果只计算一次）。"""
+    samples = _read_bid_reference_samples()
+    if not samples:
+        return ""
+
+    lines = ["### 高质量投标参考（仅参考风格与结构，禁止照搬原文）"]
+    for sample in samples[:4]:
+        author = str(sample.get("author", "Unknown"))
+        tags = sample.get("style_tags", [])
+        strengths = sample.get("strengths", [])
+        char_range = str(sample.get("length_chars_range", "700-1200"))
+        tag_text = ", ".join(str(t) for t in tags[:3]) if isinstance(tags, list) else "structured"
+        strength_text = (
+            "; ".join(str(s) for s in strengths[:2]) if isinstance(strengths, list) else "clear scope and milestones"
+        )
+        lines.append(
+            f"- {author}: style={tag_text}; length≈{char_range}; strengths={strength_text}"
+        )
+
+    lines.append("- 仅吸收其逻辑与表达节奏，不要复用具体句子。")
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_json_str(value: str) -> Any:
+    """解析 JSON 字符串（相同字符串只解析一次，结果只读使用）；解析失败返回 None。"""
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return None
+
+
+def _coerce_json(value: Any, default: Any) -> Any:
+    """字符串按 JSON 解析（失败或为 null 时返回 default），其他值原样返回。"""
+    if isinstance(value, str):
+        parsed = _parse_json_str(value)
+        return default if parsed is None else parsed
+    return value
+
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _format_project_context(
+    title: Any,
+    desc_preview: str,
+    budget_min: Any,
+    budget_max: Any,
+    currency: str,
+    bid_count: Any,
+    skills_str: str,
+    score_block: str,
+) -> str:
+    """按已规范化的项目字段组装项目上下文（相同字段组合只格式化一次）。"""
+    # 可选段落为空串，非空时各自带好换行
+    if budget_min is not None and budget_max is not None:
+        budget_line = f"- 预算范围：{budget_min}-{budget_max} {currency}\n"
+    elif budget_max is not None:
+        budget_line = f"- 预算上限：{budget_max} {currency}\n"
+    else:
+        budget_line = ""
+
+    skills_line = f"\n- 技能要求：{skills_str}" if skills_str else ""
+
+    # 添加描述摘要
+    desc_line = f"\n\n### 项目详细描述：\n{desc_preview}" if desc_preview else ""
+
+    return (
+        f"### 项目基本信息：\n- 项目名称：{title}\n{budget_line}"
+        f"- 当前竞争：{bid_count} 个竞标{skills_line}{desc_line}{score_block}"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_scoring_prompt(base_system_prompt: str, project_context: str) -> str:
+    """
+    组装评分提示词（按内容去重）。
+
+    项目上下文来自带缓存的 _format_project_context，命中时为同一字符串对象，
+    哈希值已缓存，因此重复项目的查找几乎无额外开销；内容变化时自然生成新条目。
+    """
+    return f"""你是 Freelancer 平台的资深项目评估专家。
+
+{base_system_prompt}
+
+项目信息：
+{project_context}
+
+请根据以上信息评估项目并返回 JSON 结果。
 """
 
 
+# 简历技能分类说明（按 RESUME_SKILL_MAPPINGS 的分类 ID）
+_RESUME_CATEGORY_DESC = {
+    101: "Backend/API engineering with Python, FastAPI, Java, Spring Boot, and Spring Cloud.",
+    102: "Microservice architecture including service discovery, configuration center, API gateway, and service governance.",
+    103: "Security and auth implementation with OAuth2, RBAC, and API authorization.",
+    104: "AI/LLM engineering with LangChain, RAG retrieval, vector databases, multi-LLM integration, and prompt engineering.",
+    105: "Database delivery across MySQL, SQLite, SQL modeling, and enterprise persistence layers.",
+    106: "Containerized delivery with Docker, Docker Compose, DevOps pipelines, and production-oriented deployment.",
+    107: "Media processing with FFmpeg for video composition and subtitle rendering.",
+}
+
+
+# (RESUME_SKILL_MAPPINGS 对象, 按分类 ID 分组的关键词匹配器)：映射对象不变时无需重新编译
+_resume_matcher_cache: Optional[Tuple[Dict[int, List[str]], KeywordMatcher]] = None
+
+
+def _resume_skill_matcher() -> KeywordMatcher:
+    """返回按分类 ID 分组的简历技能匹配器（小写关键词），按映射对象身份缓存。"""
+    global _resume_matcher_cache
+    mappings = settings.RESUME_SKILL_MAPPINGS
+    cached = _resume_matcher_cache
+    if cached is not None and cached[0] is mappings:
+        return cached[1]
+    matcher = KeywordMatcher(
+        {
+            cid: [str(keyword).lower() for keyword in keywords]
+            for cid, keywords in mappings.items()
+        }
+    )
+    _resume_matcher_cache = (mappings, matcher)
+    return matcher
+
+
+@functools.lru_cache(maxsize=1)
+def _resume_highlights() -> str:
+    """
+    读取简历指南并提取可证明的项目成绩（进程内只计算一次）。
+
+    只缓存提取结果，不保留 markdown 原文；读取失败时按空简历处理。
+    """
+    try:
+        resume_md = _resume_guide_path().read_text(encoding="utf-8")
+    except Exception:
+        resume_md = ""
+
+    highlights: List[str] = []
+    if "100+并发请求" in resume_md:
+        highlights.append(
+            "Delivered AI systems handling 100+ concurrent requests in production scenarios."
+        )
+    if "<2秒" in resume_md or "<3秒" in resume_md:
+        highlights.append(
+            "Optimized response latency with sub-2s dialogue and sub-3s retrieval performance."
+        )
+    if "效率提升15-26%" in resume_md:
+        highlights.append(
+            "Improved end-to-end media generation efficiency by 15-26% via parallelized workflows."
+        )
+    if "19个REST端点" in resume_md:
+        highlights.append(
+            "Built and maintained a full automation backend with 19 REST endpoints across core modules."
+        )
+
+    if not highlights:
+        highlights.append(
+            "Hands-on delivery across AI platforms, microservices, and workflow automation systems."
+        )
+
+    return "\n".join(f"- {item}" for item in highlights[:3])
+
+
+@functools.lru_cache(maxsize=128)
+def _format_resume_context(
+    matched_ids: Tuple[int, ...],
+    highlights_text: str,
+) -> str:
+    """按命中的简历技能分类组装背景段落（同一分类组合只拼接一次）。"""
+    if not matched_ids:
+        matched_ids = (101, 104, 106)
+
+    skills_text = "\n".join(
+        f"- {_RESUME_CATEGORY_DESC.get(cid, 'Relevant professional capability.')}"
+        for cid in matched_ids[:4]
+    )
+
+    return (
+        "### 候选人职业背景（来自个人简历-核心能力）\n"
+        f"{skills_text}\n"
+        "### 候选人可证明的项目成绩\n"
+        f"{highlights_text}"
+    )
+
+
 class ProposalPromptBuilder:
     """
     提示词构建器
@@ -153,12 +367,20 @@ class ProposalPromptBuilder:
         self.base_system_prompt = base_system_prompt or BASE_SYSTEM_PROMPT
         self.style_instructions = style_instructions or STYLE_NARRATIVE
         self.structure_instructions = structure_instructions or STRUCTURE_THREE_STEP
-        self._resume_markdown_cache: Optional[str] = None
-        self._bid_reference_samples_cache: Optional[List[Dict[str, Any]]] = None
+        # 提案长度要求（配置加载后不再变化，构造时解析一次）
+        self._target_char_min = max(200, int(getattr(settings, "PROPOSAL_TARGET_CHAR_MIN", 700)))
+        self._target_char_max = max(
+            self._target_char_min + 50, int(getattr(settings, "PROPOSAL_TARGET_CHAR_MAX", 1200))
+        )
+        self._hard_char_max = max(
+            self._target_char_max, int(getattr(settings, "PROPOSAL_MAX_LENGTH", 1800))
+        )
+        # (style, structure) -> 提示词中与项目无关的尾部（参考样例、风格、结构、要求）
+        self._prompt_skeletons: Dict[Tuple[str, str], str] = {}
 
         logger.debug("ProposalPromptBuilder initialized with custom instructions")
 
-    def fetch_prompts(self, db: Session):
+    def fetch_prompts(self, db: "Session"):
         """Fetch active prompts from database and update builder state."""
         from database.models import PromptTemplate
         
@@ -171,6 +393,7 @@ class ProposalPromptBuilder:
         if template:
             # We use this as base system prompt for proposals
             self.base_system_prompt = template.content
+            self._prompt_skeletons.clear()
             logger.info(f"Updated proposal base prompt from DB: {template.name}")
         
         # Optional: could also fetch style/structure from DB if we added those categories
@@ -192,25 +415,28 @@ class ProposalPromptBuilder:
         Returns:
             完整的系统提示词
         """
-        # 获取项目上下文
-        project_context = self.build_project_context(project)
-
-        # 根据风格和结构选择对应的指令
-        style_section = self._get_style_section(style)
-        structure_section = self._get_structure_section(structure)
-        reference_section = self.build_bid_reference_context()
-        target_char_min = max(200, int(getattr(settings, "PROPOSAL_TARGET_CHAR_MIN", 700)))
-        target_char_max = max(target_char_min + 50, int(getattr(settings, "PROPOSAL_TARGET_CHAR_MAX", 1200)))
-        hard_char_max = max(target_char_max, int(getattr(settings, "PROPOSAL_MAX_LENGTH", 1800)))
+        skeleton = self._prompt_skeletons.get((style, structure))
+        if skeleton is None:
+            skeleton = self._prompt_skeletons[(style, structure)] = (
+                sys.intern(self._build_prompt_skeleton(style, structure))
+            )
 
-        # 组装完整提示词
-        full_prompt = f"""You are a senior freelance developer on Freelancer.com, known for winning high-quality projects through personalized, technical, and persuasive proposals.
+        # 仅项目上下文与简历匹配随项目变化，其余部分复用缓存的骨架
+        return f"""{PROPOSAL_PROMPT_INTRO}
 
-{project_context}
+{self.build_project_context(project)}
 
 {self.build_resume_context(project)}
 
-{reference_section}
+{skeleton}"""
+
+    def _build_prompt_skeleton(self, style: str, structure: str) -> str:
+        """组装提示词中与项目无关的部分（每个 style/structure 组合只构建一次）"""
+        style_section = self._get_style_section(style)
+        structure_section = self._get_structure_section(structure)
+        reference_section = self.build_bid_reference_context()
+
+        return f"""{reference_section}
 
 {style_section}
 
@@ -220,7 +446,7 @@ Please generate a professional, person-to-person proposal based on the informati
 
 Requirements:
 - Language: English only. Write directly in English, do not translate from Chinese.
-- Length: Target {target_char_min}-{target_char_max} characters; Hard limit {hard_char_max} characters.
+- Length: Target {self._target_char_min}-{self._target_char_max} characters; Hard limit {self._hard_char_max} characters.
 - Tone: Professional, confident, and consultative. Avoid generic "I am an expert" phrases. Instead, show expertise through technical insight.
 - Natural Expression: Do NOT use bold text for keywords. Avoid excessive Markdown formatting. No bullet points or numbered lists; use natural paragraphs.
 - Specificity: Reference specific technologies or requirements mentioned in the project title and description to show you've read it carefully.
@@ -232,8 +458,6 @@ Requirements:
 - **Project-Specific Detail**: You MUST quote or paraphrase at least one specific requirement from the project description to prove you read it.
 """
 
-        return full_prompt
-
     def _get_style_section(self, style: str) -> str:
         """获取风格指令"""
         style_map = {
@@ -270,6 +494,8 @@ Requirements:
         description = project.get("description", "") or project.get(
             "preview_description", ""
         )
+        # 先截断再作为缓存键：长描述只按前 2000 字符哈希与存储
+        desc_preview = description[:2000] if description else ""
 
         # 预算信息
         budget_obj = project.get("budget") or {}
@@ -280,199 +506,77 @@ Requirements:
         currency = project.get("currency_code", "USD")
 
         # 技能要求
-        skills = project.get("skills", [])
-        if isinstance(skills, str):
-            try:
-                skills = json.loads(skills)
-            except json.JSONDecodeError:
-                skills = []
+        skills = _coerce_json(project.get("skills", []), [])
 
         # 竞争情况
-        bid_stats = project.get("bid_stats") or {}
-        if isinstance(bid_stats, str):
-            try:
-                bid_stats = json.loads(bid_stats)
-            except json.JSONDecodeError:
-                bid_stats = {}
+        bid_stats = _coerce_json(project.get("bid_stats") or {}, {})
         if not isinstance(bid_stats, dict):
             bid_stats = {}
         bid_count = bid_stats.get("bid_count", 0)
 
-        # 客户信息
-        owner_info = project.get("owner_info") or {}
-        if isinstance(owner_info, str):
-            try:
-                owner_info = json.loads(owner_info)
-            except json.JSONDecodeError:
-                owner_info = {}
-        if not isinstance(owner_info, dict):
-            owner_info = {}
-
-        # 构建上下文描述
-        context_parts = ["### 项目基本信息："]
-        context_parts.append(f"- 项目名称：{title}")
-
-        if budget_min is not None and budget_max is not None:
-            context_parts.append(f"- 预算范围：{budget_min}-{budget_max} {currency}")
-        elif budget_max is not None:
-            context_parts.append(f"- 预算上限：{budget_max} {currency}")
-
-        context_parts.append(f"- 当前竞争：{bid_count} 个竞标")
-
-        if skills:
-            skills_str = (
-                ", ".join(skills[:5]) if isinstance(skills, list) else str(skills)
-            )
-            context_parts.append(f"- 技能要求：{skills_str}")
-
-        # 添加描述摘要
-        if description:
-            desc_preview = description[:2000] if len(description) > 2000 else description
-            context_parts.append(f"\n### 项目详细描述：\n{desc_preview}")
+        # 列表取前 5 项（元素统一转为 str）；单个字符串原样使用；其他结构不输出
+        if isinstance(skills, list):
+            skills_str = ", ".join(map(str, skills[:5]))
+        elif isinstance(skills, str):
+            skills_str = skills
+        else:
+            skills_str = ""
 
-        # 添加评分数据（如有）
+        # 评分数据（如有）：逐次格式化，不进入缓存键
+        score_block = ""
         if score_data:
-            context_parts.append("\n### AI 分析结果：")
+            score_block = "\n\n### AI 分析结果："
             if score_data.get("score") is not None:
-                context_parts.append(f"- 综合评分：{score_data['score']:.1f}/10")
+                score_block += f"\n- 综合评分：{score_data['score']:.1f}/10"
             if score_data.get("reason"):
-                context_parts.append(f"- 评分理由：{score_data['reason']}")
+                score_block += f"\n- 评分理由：{score_data['reason']}"
             if score_data.get("estimated_hours"):
-                context_parts.append(
-                    f"- 预估工时：{score_data['estimated_hours']} 小时"
-                )
+                score_block += f"\n- 预估工时：{score_data['estimated_hours']} 小时"
             if score_data.get("suggested_bid"):
-                context_parts.append(
-                    f"- 建议报价：{score_data['suggested_bid']} {currency}"
-                )
-
-        return "\n".join(context_parts)
-
-    def _load_resume_markdown(self) -> str:
-        """Load resume guide markdown from docs; best-effort only."""
-        if self._resume_markdown_cache is not None:
-            return self._resume_markdown_cache
+                score_block += f"\n- 建议报价：{score_data['suggested_bid']} {currency}"
 
+        args = (
+            title, desc_preview, budget_min, budget_max, currency,
+            bid_count, skills_str, score_block,
+        )
         try:
-            self._resume_markdown_cache = RESUME_GUIDE_PATH.read_text(encoding="utf-8")
-        except Exception:
-            self._resume_markdown_cache = ""
-        return self._resume_markdown_cache
+            return _format_project_context(*args)
+        except TypeError:
+            # 字段值不可哈希（如嵌套 dict），跳过缓存直接格式化
+            return _format_project_context.__wrapped__(*args)
 
     def build_resume_context(self, project: Dict[str, Any]) -> str:
         """
         Build concise career profile context from resume for proposal prompting.
         """
+        # 技能只用于关键词检索，直接拼接为文本，无需 JSON 序列化
+        skills = project.get("skills", [])
+        skills_text = (
+            " ".join(map(str, skills)) if isinstance(skills, list) else str(skills or "")
+        )
         project_text = " ".join(
             [
                 str(project.get("title", "")),
                 str(project.get("description", "")),
                 str(project.get("preview_description", "")),
-                json.dumps(project.get("skills", []), ensure_ascii=False),
+                skills_text,
             ]
         ).lower()
 
-        category_desc = {
-            101: "Backend/API engineering with Python, FastAPI, Java, Spring Boot, and Spring Cloud.",
-            102: "Microservice architecture including service discovery, configuration center, API gateway, and service governance.",
-            103: "Security and auth implementation with OAuth2, RBAC, and API authorization.",
-            104: "AI/LLM engineering with LangChain, RAG retrieval, vector databases, multi-LLM integration, and prompt engineering.",
-            105: "Database delivery across MySQL, SQLite, SQL modeling, and enterprise persistence layers.",
-            106: "Containerized delivery with Docker, Docker Compose, DevOps pipelines, and production-oriented deployment.",
-            107: "Media processing with FFmpeg for video composition and subtitle rendering.",
-        }
-
-        matched_ids: List[int] = []
-        for cid, keywords in settings.RESUME_SKILL_MAPPINGS.items():
-            if any(str(keyword).lower() in project_text for keyword in keywords):
-                matched_ids.append(cid)
-
-        if not matched_ids:
-            matched_ids = [101, 104, 106]
+        # 一次扫描匹配全部分类（结果按 RESUME_SKILL_MAPPINGS 中的分类顺序排列）；
+        # 缓存只以分类组合为键，不保留项目原文
+        matched_ids = tuple(_resume_skill_matcher().find(project_text))
+        return _format_resume_context(matched_ids, _resume_highlights())
 
-        skills_text = "\n".join(
-            f"- {category_desc.get(cid, 'Relevant professional capability.')}"
-            for cid in matched_ids[:4]
-        )
-
-        resume_md = self._load_resume_markdown()
-        highlights: List[str] = []
-        if "100+并发请求" in resume_md:
-            highlights.append(
-                "Delivered AI systems handling 100+ concurrent requests in production scenarios."
-            )
-        if "<2秒" in resume_md or "<3秒" in resume_md:
-            highlights.append(
-                "Optimized response latency with sub-2s dialogue and sub-3s retrieval performance."
-            )
-        if "效率提升15-26%" in resume_md:
-            highlights.append(
-                "Improved end-to-end media generation efficiency by 15-26% via parallelized workflows."
-            )
-        if "19个REST端点" in resume_md:
-            highlights.append(
-                "Built and maintained a full automation backend with 19 REST endpoints across core modules."
-            )
-
-        if not highlights:
-            highlights.append(
-                "Hands-on delivery across AI platforms, microservices, and workflow automation systems."
-            )
-
-        highlights_text = "\n".join(f"- {item}" for item in highlights[:3])
-
-        return (
-            "### 候选人职业背景（来自个人简历-核心能力）\n"
-            f"{skills_text}\n"
-            "### 候选人可证明的项目成绩\n"
-            f"{highlights_text}"
-        )
-
-    def _load_bid_reference_samples(self) -> List[Dict[str, Any]]:
+    def _load_bid_reference_samples(self) -> Tuple[Dict[str, Any], ...]:
         """Load shortlisted bid reference samples for style guidance."""
-        if self._bid_reference_samples_cache is not None:
-            return self._bid_reference_samples_cache
-
-        try:
-            payload = json.loads(
-                BID_REFERENCE_SAMPLES_PATH.read_text(encoding="utf-8")
-            )
-            samples = payload.get("samples", [])
-            if isinstance(samples, list):
-                self._bid_reference_samples_cache = [
-                    item for item in samples if isinstance(item, dict)
-                ]
-            else:
-                self._bid_reference_samples_cache = []
-        except Exception:
-            self._bid_reference_samples_cache = []
-
-        return self._bid_reference_samples_cache
+        return _read_bid_reference_samples()
 
     def build_bid_reference_context(self) -> str:
         """
         Build style/structure references from curated real bid samples.
         """
-        samples = self._load_bid_reference_samples()
-        if not samples:
-            return ""
-
-        lines = ["### 高质量投标参考（仅参考风格与结构，禁止照搬原文）"]
-        for sample in samples[:4]:
-            author = str(sample.get("author", "Unknown"))
-            tags = sample.get("style_tags", [])
-            strengths = sample.get("strengths", [])
-            char_range = str(sample.get("length_chars_range", "700-1200"))
-            tag_text = ", ".join(str(t) for t in tags[:3]) if isinstance(tags, list) else "structured"
-            strength_text = (
-                "; ".join(str(s) for s in strengths[:2]) if isinstance(strengths, list) else "clear scope and milestones"
-            )
-            lines.append(
-                f"- {author}: style={tag_text}; length≈{char_range}; strengths={strength_text}"
-            )
-
-        lines.append("- 仅吸收其逻辑与表达节奏，不要复用具体句子。")
-        return "\n".join(lines)
+        return _render_bid_reference_context()
 
     def build_scoring_prompt(self, project: Dict[str, Any]) -> str:
         """
@@ -484,17 +588,9 @@ Requirements:
         Returns:
             评分专用的系统提示词
         """
-        project_context = self.build_project_context(project)
-
-        return f"""你是 Freelancer 平台的资深项目评估专家。
-
-{self.base_system_prompt}
-
-项目信息：
-{project_context}
-
-请根据以上信息评估项目并返回 JSON 结果。
-"""
+        return _format_scoring_prompt(
+            self.base_system_prompt, self.build_project_context(project)
+        )
 
     def get_system_prompt_for_scoring(self) -> str:
         """
@@ -527,3 +623,17 @@ def reset_prompt_builder() -> None:
     """重置提示词构建器单例（用于测试）"""
     global _builder
     _builder = None
+
+
+def warmup_prompt_builder() -> None:
+    """
+    预热提示词构建相关缓存（应用启动时调用）
+
+    预先读取简历与投标参考样例、编译技能匹配器并构建默认风格/结构的提示词骨架，
+    使首个提案请求不再承担这些一次性开销。
+    """
+    _resume_highlights()
+    _resume_skill_matcher()
+    _render_bid_reference_context()
+    get_proposal_prompt_builder().build_prompt({})
+    logger.debug("Proposal prompt builder caches warmed up")
@@ -18,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import re
 import time
 from dataclasses import dataclass, field
@@ -27,6 +28,8 @@ from sqlalchemy.orm import Session
 
 from config import settings
 from database.models import Project
+from services.proposal_prompt_builder import ProposalPromptBuilder
+from utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,77 @@ _LEGACY_QUOTE_NUMBER_PATTERN = re.compile(
     r"(?:budget|quote|bid|price|\$|usd|eur|gbp|cad|aud|sgd|cny)\D{0,80}((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?)",
     re.IGNORECASE,
 )
+_WORD_RE = re.compile(r"\b\w+\b")
+# 仅含空白字符（含 \xA0 等 Unicode 空白）的行，等价于 split("\n") 后 not line.strip()
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]*$", re.MULTILINE)
+_TITLE_TOKEN_RE = re.compile(r"[a-z][a-z0-9#+-]{3,}")
+_ANCHOR_TOKEN_RE = re.compile(r"[a-z0-9+#-]{3,}")
+# AI 模板化短语
+_COMMON_PHRASES: Tuple[str, ...] = (
+    "我有丰富的经验",
+    "了解您的需求",
+    "这正是我的专长领域",
+    "我可以提供完整的解决方案",
+    "我将仔细分析需求",
+    "包括需求分析、开发、测试和部署",
+    "基于我的相关经验",
+    "作为一名经验丰富的开发者",
+    "我的技术栈包括",
+    "能够快速交付高质量结果",
+)
+# 关键词堆砌检测用的技术词
+_TECH_KEYWORDS: Tuple[str, ...] = (
+    "python",
+    "fastapi",
+    "api",
+    "automation",
+    "workflow",
+    "django",
+    "flask",
+)
+# 结构化表达（技术方案/交付计划）标志词，均为小写
+_REQUIRED_SECTIONS: Tuple[str, ...] = (
+    "方案",
+    "计划",
+    "技术",
+    "实现",
+    "交付",
+    "架构",
+    "plan",
+    "technical",
+    "implementation",
+    "delivery",
+    "architecture",
+    "approach",
+    "solution",
+)
+# 模板短语 / 技术关键词 / 结构词三组一次扫描完成匹配
+_VALIDATION_PHRASE_MATCHER = KeywordMatcher(
+    {
+        "common": _COMMON_PHRASES,
+        "tech": _TECH_KEYWORDS,
+        "section": _REQUIRED_SECTIONS,
+    }
+)
+# 标题关键词回退时忽略的常见词
+_TITLE_STOP_WORDS = frozenset(
+    {
+        "with",
+        "for",
+        "and",
+        "the",
+        "task",
+        "project",
+        "build",
+        "need",
+        "from",
+        "using",
+        "into",
+        "your",
+        "this",
+    }
+)
+_ANCHOR_STOP_WORDS = frozenset({"with", "for", "and", "the", "task", "project"})
 _PROJECT_REQUIREMENT_HINTS: List[Tuple[Tuple[str, ...], str]] = [
     (("state machine", "fsm"), "state machine"),
     (("otp", "one-time password"), "otp verification"),
@@ -140,6 +214,9 @@ class ProposalConfig:
         fallback_enabled: 是否启用回退机制
         model: 使用的模型名称
         temperature: 生成温度 (0.0-1.0)
+        retry_base_delay: 可重试错误（限流/超时）的指数退避基数（秒）
+        retry_max_delay: 单次退避等待上限（秒）
+        max_concurrency: 批量生成时的最大并发 LLM 请求数
     """
 
     max_retries: int = 3
@@ -152,6 +229,9 @@ class ProposalConfig:
     fallback_enabled: bool = True
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    max_concurrency: int = 20
 
     @classmethod
     def from_settings(cls) -> "ProposalConfig":
@@ -167,12 +247,19 @@ class ProposalConfig:
             fallback_enabled=True,
             model=getattr(settings, "LLM_MODEL", "gpt-4o-mini"),
             temperature=0.7,
+            retry_base_delay=getattr(settings, "PROPOSAL_RETRY_BASE_DELAY", 1.0),
+            retry_max_delay=getattr(settings, "PROPOSAL_RETRY_MAX_DELAY", 30.0),
+            max_concurrency=getattr(settings, "PROPOSAL_MAX_CONCURRENCY", 20),
         )
 
 
 class DefaultProposalValidator:
     """默认提案验证器"""
 
+    COMMON_PHRASES: Tuple[str, ...] = _COMMON_PHRASES
+    TECH_KEYWORDS: Tuple[str, ...] = _TECH_KEYWORDS
+    REQUIRED_SECTIONS: Tuple[str, ...] = _REQUIRED_SECTIONS
+
     def __init__(
         self,
         min_length: int = 200,
@@ -202,37 +289,20 @@ class DefaultProposalValidator:
         if len(proposal) > self.max_length:
             issues.append(f"提案过长（{len(proposal)} > {self.max_length} 字符）")
 
+        # 模板短语 / 技术关键词 / 结构词三组在一次扫描中完成匹配
+        # （模板短语均为中文，对小写化文本匹配与原文等价）
+        proposal_lower = proposal.lower()
+        phrase_hits = _VALIDATION_PHRASE_MATCHER.find(proposal_lower)
+
         # 2. 检查是否包含 AI 模板化内容
-        common_phrases = [
-            "我有丰富的经验",
-            "了解您的需求",
-            "这正是我的专长领域",
-            "我可以提供完整的解决方案",
-            "我将仔细分析需求",
-            "包括需求分析、开发、测试和部署",
-            "基于我的相关经验",
-            "作为一名经验丰富的开发者",
-            "我的技术栈包括",
-            "能够快速交付高质量结果",
-        ]
-        common_count = sum(1 for phrase in common_phrases if phrase in proposal)
+        common_count = len(phrase_hits.get("common", ()))
         if common_count >= 3:
             issues.append(f"AI 模板化内容过多 ({common_count}处)")
 
         # 3. 关键词堆砌检测
-        tech_keywords = [
-            "python",
-            "fastapi",
-            "api",
-            "automation",
-            "workflow",
-            "django",
-            "flask",
-        ]
-        proposal_lower = proposal.lower()
-        words = re.findall(r"\b\w+\b", proposal_lower)
+        words = _WORD_RE.findall(proposal_lower)
         if len(words) > 20:
-            keyword_count = sum(1 for k in tech_keywords if k in proposal_lower)
+            keyword_count = len(phrase_hits.get("tech", ()))
             if keyword_count / len(words) > 0.35:
                 issues.append("关键词堆砌过密（缺乏自然表达）")
 
@@ -246,46 +316,25 @@ class DefaultProposalValidator:
                 issues.append("与项目描述关联度低（缺乏针对性）")
 
         # 5. 结构化检查（是否包含技术方案、交付计划）
-        required_sections = [
-            "方案",
-            "计划",
-            "技术",
-            "实现",
-            "交付",
-            "架构",
-            "plan",
-            "technical",
-            "implementation",
-            "delivery",
-            "architecture",
-            "approach",
-            "solution",
-        ]
-        has_sections = sum(1 for s in required_sections if s.lower() in proposal_lower)
+        has_sections = len(phrase_hits.get("section", ()))
         if has_sections < 1:
             issues.append("缺乏结构化表达（技术方案/交付计划）")
 
         # 6. 重复句式检测
+        # 重复次数 = 非空句子数 - 去重后句子数（集合构造在 C 层完成）
         sentences = proposal.split("。")
-        unique_sentences = set()
-        duplicate_count = 0
-        for s in sentences:
-            s_clean = s.strip()
-            if s_clean:
-                if s_clean in unique_sentences:
-                    duplicate_count += 1
-                unique_sentences.add(s_clean)
+        non_empty = [s for s in map(str.strip, sentences) if s]
+        duplicate_count = len(non_empty) - len(set(non_empty))
 
         if duplicate_count >= 2 and len(sentences) > 3:
             issues.append(f"存在重复句式 ({duplicate_count}处)")
 
         # 7. 检查是否为空行或仅包含特殊字符（放宽限制：从30%提高到50%）
-        lines = proposal.split("\n")
-        empty_lines = sum(
-            1 for line in lines if not line.strip() or re.match(r"^[\s\t\xA0]+$", line)
-        )
-        if empty_lines > len(lines) * 0.5:
-            issues.append(f"空行过多（{empty_lines}/{len(lines)}）")
+        # 单次正则扫描统计空白行，不再构造逐行列表
+        line_count = proposal.count("\n") + 1
+        empty_lines = len(_BLANK_LINE_RE.findall(proposal))
+        if empty_lines > line_count * 0.5:
+            issues.append(f"空行过多（{empty_lines}/{line_count}）")
 
         # 8. 项目关键锚点覆盖检查（确保标书针对性）
         anchors = self._extract_project_anchor_terms(project)
@@ -338,25 +387,10 @@ class DefaultProposalValidator:
 
         # Fallback: title keywords
         raw_title = str(project.get("title", "") or "").lower()
-        stop_words = {
-            "with",
-            "for",
-            "and",
-            "the",
-            "task",
-            "project",
-            "build",
-            "need",
-            "from",
-            "using",
-            "into",
-            "your",
-            "this",
-        }
-        tokens = re.findall(r"[a-z][a-z0-9#+-]{3,}", raw_title)
+        tokens = _TITLE_TOKEN_RE.findall(raw_title)
         deduped: List[str] = []
         for token in tokens:
-            if token in stop_words or token in deduped:
+            if token in _TITLE_STOP_WORDS or token in deduped:
                 continue
             deduped.append(token)
         return deduped[:3]
@@ -375,9 +409,8 @@ class DefaultProposalValidator:
 
             # Phrase fallback: allow partial token coverage for labels like
             # "whatsapp integration" even when proposal says "whatsapp webhook".
-            tokens = re.findall(r"[a-z0-9+#-]{3,}", anchor.lower())
-            stop_words = {"with", "for", "and", "the", "task", "project"}
-            tokens = [token for token in tokens if token not in stop_words]
+            tokens = _ANCHOR_TOKEN_RE.findall(anchor.lower())
+            tokens = [token for token in tokens if token not in _ANCHOR_STOP_WORDS]
             if not tokens:
                 continue
             token_hits = sum(1 for token in tokens if token in proposal_lower)
@@ -541,6 +574,44 @@ class LLMClientProtocol(Protocol):
         ...
 
 
+_RETRIABLE_STATUS_CODES = frozenset({408, 409, 429})
+_DEFAULT_MAX_OUTPUT_TOKENS = 2000
+
+
+class EmptyLLMResponseError(ValueError):
+    """LLM 返回空内容（瞬时性失败，重试通常可恢复）"""
+
+
+def _is_retriable_llm_error(exc: Optional[BaseException]) -> bool:
+    """
+    判断 LLM 调用异常是否值得退避重试。
+
+    限流（429）、超时、连接错误、5xx 与空响应视为瞬时错误；鉴权失败、请求参数错误等
+    重试无意义，直接失败。会沿 ``__cause__`` 链检查（多 Provider 适配器包装后的异常）。
+    """
+    try:
+        from openai import APIConnectionError, RateLimitError
+
+        transient: Tuple[type, ...] = (APIConnectionError, RateLimitError)
+    except ImportError:  # pragma: no cover - 取决于运行环境
+        transient = ()
+
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(
+            exc,
+            (EmptyLLMResponseError, asyncio.TimeoutError, TimeoutError, ConnectionError)
+            + transient,
+        ):
+            return True
+        status = getattr(exc, "status_code", None)
+        if isinstance(status, int) and (status in _RETRIABLE_STATUS_CODES or status >= 500):
+            return True
+        exc = exc.__cause__
+    return False
+
+
 class OpenAILLMClientAdapter:
     """OpenAI LLM 客户端适配器"""
 
@@ -551,6 +622,7 @@ class OpenAILLMClientAdapter:
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
         provider_name: str = "openai",
+        max_output_tokens: int = _DEFAULT_MAX_OUTPUT_TOKENS,
     ):
         if not api_key:
             raise ValueError("Missing LLM_API_KEY")
@@ -561,16 +633,19 @@ class OpenAILLMClientAdapter:
         self._model = model
         self._base_url = base_url
         self._provider_name = provider_name
+        self._max_output_tokens = max_output_tokens
 
         try:
             from openai import AsyncOpenAI
         except Exception as e:
             raise RuntimeError(f"OpenAI SDK not available: {e}")
 
+        # 重试由 ProposalService 统一负责（指数退避），关闭 SDK 内置重试避免叠加
         self._client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
+            max_retries=0,
         )
 
     async def generate_proposal(
@@ -590,12 +665,12 @@ class OpenAILLMClientAdapter:
                     {"role": "user", "content": user_prompt},
                 ],
                 temperature=temperature,
-                max_tokens=2000,
+                max_tokens=self._max_output_tokens,
             )
 
             content = (result.choices[0].message.content or "").strip()
             if not content:
-                raise ValueError("LLM returned empty content")
+                raise EmptyLLMResponseError("LLM returned empty content")
 
             return content
 
@@ -617,6 +692,7 @@ class MultiProviderLLMClientAdapter:
         providers: List[Dict[str, Any]],
         default_model: str,
         timeout: Optional[float] = None,
+        max_output_tokens: int = _DEFAULT_MAX_OUTPUT_TOKENS,
     ):
         self._clients: List[Tuple[str, str, OpenAILLMClientAdapter]] = []
 
@@ -635,6 +711,7 @@ class MultiProviderLLMClientAdapter:
                 base_url=base_url,
                 timeout=timeout,
                 provider_name=name,
+                max_output_tokens=max_output_tokens,
             )
             self._clients.append((name, model, client))
 
@@ -650,6 +727,8 @@ class MultiProviderLLMClientAdapter:
         temperature: float,
     ) -> str:
         errors: List[str] = []
+        # 优先保留可重试的错误作为 __cause__，便于上层决定是否退避重试
+        cause: Optional[Exception] = None
 
         for name, provider_model, client in self._clients:
             try:
@@ -667,9 +746,13 @@ class MultiProviderLLMClientAdapter:
                     exc,
                 )
                 errors.append(f"{name}: {exc}")
+                if cause is None or not _is_retriable_llm_error(cause):
+                    cause = exc
                 continue
 
-        raise RuntimeError("All proposal LLM providers failed: " + " | ".join(errors))
+        raise RuntimeError(
+            "All proposal LLM providers failed: " + " | ".join(errors)
+        ) from cause
 
 
 class ProposalService:
@@ -702,8 +785,6 @@ class ProposalService:
             validator: 提案验证器
             config: 服务配置
         """
-        from services.proposal_prompt_builder import ProposalPromptBuilder
-
         self.config = config or ProposalConfig.from_settings()
         self.prompt_builder = prompt_builder or ProposalPromptBuilder()
         self.validator = validator or DefaultProposalValidator(
@@ -737,6 +818,7 @@ class ProposalService:
                 providers=providers,
                 default_model=self.config.model,
                 timeout=self.config.timeout,
+                max_output_tokens=self._max_output_tokens(),
             )
 
         # 兼容旧配置：仅使用 LLM_API_KEY + LLM_MODEL + LLM_API_URL
@@ -752,8 +834,13 @@ class ProposalService:
             base_url=base_url,
             timeout=self.config.timeout,
             provider_name=primary or "openai",
+            max_output_tokens=self._max_output_tokens(),
         )
 
+    def _max_output_tokens(self) -> int:
+        """按提案字符上限推导输出 token 上限（宽松估算，避免截断）"""
+        return max(1, min(_DEFAULT_MAX_OUTPUT_TOKENS, int(self.config.max_length * 1.5)))
+
     async def generate_proposal(
         self,
         project: Project,
@@ -916,12 +1003,12 @@ class ProposalService:
             except Exception as e:
                 logger.error(f"Proposal generation attempt {attempt + 1} failed: {e}")
 
-                if attempt < effective_max_retries - 1:
-                    # 等待后重试
-                    await asyncio.sleep(1 * (attempt + 1))
+                # 仅限流/超时等瞬时错误退避重试；其余错误直接失败，避免浪费配额
+                if attempt < effective_max_retries - 1 and _is_retriable_llm_error(e):
+                    await asyncio.sleep(self._retry_delay(attempt))
                     continue
 
-                # 所有尝试都失败
+                # 所有尝试都失败（或不可重试）
                 return self._create_result(
                     success=False,
                     proposal="",
@@ -933,6 +1020,75 @@ class ProposalService:
                     error=str(e),
                 )
 
+    def _retry_delay(self, attempt: int) -> float:
+        """指数退避 + 随机抖动，避免并发任务同时重试"""
+        base = self.config.retry_base_delay
+        delay = base * (2 ** attempt) + random.uniform(0, base)
+        return min(delay, self.config.retry_max_delay)
+
+    async def generate_proposals_batch(
+        self,
+        projects: List[Project],
+        score_data: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: Optional[int] = None,
+        db: Optional[Session] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        批量并发生成提案（信号量限制并发）
+
+        Args:
+            projects: 项目列表
+            score_data: 与 projects 一一对应的评分数据（可选）
+            max_concurrency: 最大并发数（覆盖配置）
+            db: 可选的数据库会话，仅在并发前用于刷新一次提示词
+
+        Returns:
+            与 projects 顺序一致的结果列表，格式同 generate_proposal；
+            单个项目抛出的异常会被转换为失败结果，不影响其他项目
+        """
+        if score_data is not None and len(score_data) != len(projects):
+            raise ValueError("score_data must have the same length as projects")
+
+        # Session 不能在并发任务间共享：提前刷新一次提示词，任务内不再传 db
+        if db:
+            self.prompt_builder.fetch_prompts(db)
+
+        sem = asyncio.Semaphore(max(1, max_concurrency or self.config.max_concurrency))
+        start_time = time.time()
+
+        async def _generate_one(
+            project: Project, data: Optional[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            async with sem:
+                return await self.generate_proposal(project, data)
+
+        tasks = [
+            _generate_one(project, data)
+            for project, data in zip(projects, score_data or [None] * len(projects))
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        outputs: List[Dict[str, Any]] = []
+        for project, result in zip(projects, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Batch proposal generation failed for project %s: %s",
+                    getattr(project, "freelancer_id", None),
+                    result,
+                )
+                result = self._create_result(
+                    success=False,
+                    proposal="",
+                    attempts=0,
+                    validation_passed=False,
+                    validation_issues=[],
+                    model=self.config.model,
+                    start_time=start_time,
+                    error=str(result),
+                )
+            outputs.append(result)
+        return outputs
+
     def _validate_proposal(
         self, proposal: str, project: Dict[str, Any]
     ) -> Tuple[bool, List[str]]:
@@ -1014,9 +1170,8 @@ class ProposalService:
         skills = project.get("skills")
         if skills:
             if isinstance(skills, str):
-                import json as _json
                 try:
-                    skills = _json.loads(skills)
+                    skills = json.loads(skills)
                 except Exception:
                     skills = []
             if isinstance(skills, list) and skills:
@@ -1062,25 +1217,10 @@ class ProposalService:
             return hints[:6]
 
         raw_title = str(project.get("title", "") or "").lower()
-        stop_words = {
-            "with",
-            "for",
-            "and",
-            "the",
-            "task",
-            "project",
-            "build",
-            "need",
-            "from",
-            "using",
-            "into",
-            "your",
-            "this",
-        }
-        tokens = re.findall(r"[a-z][a-z0-9#+-]{3,}", raw_title)
+        tokens = _TITLE_TOKEN_RE.findall(raw_title)
         fallback: List[str] = []
         for token in tokens:
-            if token in stop_words or token in fallback:
+            if token in _TITLE_STOP_WORDS or token in fallback:
                 continue
             fallback.append(token)
         return fallback[:3]
@@ -1189,8 +1329,6 @@ class ProposalService:
             return project.to_dict()
 
         # 手动转换
-        import json
-
         return {
             "id": project.freelancer_id,
             "title": project.title,
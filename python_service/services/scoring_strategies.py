@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 import logging
 from sqlalchemy.orm import Session
 
+from utils import json_codec
 from services.project_scorer import (
     ProjectScorer,
     ScoringConfig,
@@ -285,8 +286,8 @@ class LLMBasedScoringStrategy(ScoringStrategy):
             budget_minimum=project_data.get("budget_minimum"),
             budget_maximum=project_data.get("budget_maximum"),
             currency_code=project_data.get("currency_code", "USD"),
-            bid_stats=str(project_data.get("bid_stats", {})),
-            owner_info=str(project_data.get("owner_info", {})),
+            bid_stats=json_codec.dumps(project_data.get("bid_stats", {})),
+            owner_info=json_codec.dumps(project_data.get("owner_info", {})),
         )
 
         result = await service.score_single_project(
@@ -1,4 +1,5 @@
 import asyncio
+import time
 import pytest
 import sys
 from pathlib import Path
@@ -35,3 +36,20 @@ def test_get_rate_async_fallback_on_missing(monkeypatch):
     # but the plan uses asyncio.run inside a normal test.
     assert asyncio.run(_get_rate_async(converter, "VND")) == 0.000041
     assert asyncio.run(_get_rate_async(converter, "ZZZ")) is None
+
+def test_get_rates_sync_refreshes_once(monkeypatch):
+    converter = CurrencyConverter(cache_file="/tmp/test_rates.json")
+    converter.rates = {"USD": 1.0}
+    converter.last_updated = 0.0
+    calls = []
+
+    def _update(*_args, **_kwargs):
+        calls.append(1)
+        converter.rates = {"USD": 1.0, "EUR": 1.1}
+        converter.last_updated = time.time()
+
+    monkeypatch.setattr(converter, "update_rates_sync", _update)
+    rates = converter.get_rates_sync(["eur", "EUR", "INR", "USD", "XXX"])
+
+    assert len(calls) == 1
+    assert rates == {"eur": 1.1, "EUR": 1.1, "INR": 0.012, "USD": 1.0, "XXX": None}
@@ -0,0 +1,61 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import utils.json_codec as json_codec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_dumps_roundtrip(backend):
+    value = {"bid_count": 3, "name": "项目", "nested": {1: [1.5, None]}}
+
+    assert json.loads(json_codec.dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_dumps_or_none(backend):
+    assert json_codec.dumps_or_none({}) is None
+    assert json_codec.dumps_or_none(None) is None
+    assert json.loads(json_codec.dumps_or_none({"online_status": "online"})) == {
+        "online_status": "online"
+    }
+
+
+def test_dumps_indented_dataclasses(backend):
+    from dataclasses import dataclass
+    from datetime import date
+
+    @dataclass
+    class Row:
+        name: str
+        day: date
+
+    value = {"rows": [Row("项目", date(2024, 1, 2))], 1: "x"}
+    encoded = json_codec.dumps_indented(value)
+
+    assert json.loads(encoded) == {"rows": [{"name": "项目", "day": "2024-01-02"}], "1": "x"}
+    assert encoded.startswith("{\n  ")
+
+
+def test_loads_matches_stdlib(backend):
+    for text in ['{"bid_count": 9, "name": "项目"}', b"[1, 2.5, null]", "NaN", str(2**70)]:
+        expected = json.loads(text)
+        result = json_codec.loads(text)
+        assert result == expected or (result != result and expected != expected)
+
+    first = json_codec.loads('{"a": {"b": 1}}')
+    first["a"]["b"] = 2
+    assert json_codec.loads('{"a": {"b": 1}}') == {"a": {"b": 1}}
+
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads('{"a": ')
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import utils.keyword_matcher as keyword_matcher
+from utils.keyword_matcher import KeywordMatcher
+
+GROUPS = {
+    "vague": ["improve", "improvement", "insights"],
+    "scope": ["etc", "etcetera", "and more"],
+    "overlap": ["improve"],
+}
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def backend(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    elif keyword_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    return request.param
+
+
+def test_find_matches_substring_semantics(backend):
+    matcher = KeywordMatcher(GROUPS)
+    text = "we need an improvement, etcetera and more"
+
+    expected = {
+        name: [kw for kw in keywords if kw in text]
+        for name, keywords in GROUPS.items()
+        if any(kw in text for kw in keywords)
+    }
+    assert matcher.find(text) == expected
+
+
+def test_find_scans_texts_separately(backend):
+    matcher = KeywordMatcher({"skills": ["api integration", "python"]})
+
+    assert matcher.find("api", "integration with python") == {"skills": ["python"]}
+    assert matcher.find("", "") == {}
+
+
+def test_contains_any(backend):
+    matcher = KeywordMatcher({"skills": ["python", "ci/cd"], "empty": [""]})
+
+    assert matcher.contains_any("set up ci/cd pipeline")
+    assert not matcher.contains_any("java developer")
+    assert not matcher.contains_any("")
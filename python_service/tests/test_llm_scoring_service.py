@@ -227,6 +227,22 @@ def test_settings_anthropic_base_url_in_provider_config():
     assert anthropic["base_url"] == "https://lldai.online/api"
 
 
+def test_aggregate_ensemble_single_result_passthrough():
+    service = LLMScoringService()
+    single = {
+        "score": 6.5,
+        "reason": "r",
+        "suggested_bid": 120,
+        "estimated_hours": 8,
+        "hourly_rate": 15.0,
+        "provider_model": "m1",
+    }
+
+    aggregated = service._aggregate_ensemble([single])
+    assert aggregated == single
+    assert aggregated is not single
+
+
 def test_newcomer_profile_boosts_small_projects(monkeypatch):
     service = LLMScoringService()
 
@@ -1,12 +1,15 @@
+import dataclasses
 import sys
 import time
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PYTHON_SERVICE = REPO_ROOT / "python_service"
 sys.path.insert(0, str(PYTHON_SERVICE))
 
-from services.project_scorer import ProjectScorer
+from services.project_scorer import ProjectScorer, ScoringConfig, _budget_efficiency_score
 
 
 def test_small_task_multiplier_reduces_hours():
@@ -68,4 +71,178 @@ def test_competition_scoring_with_bonus():
         "submitdate": time.time() - 48 * 3600, # 48h ago
     }
     score = scorer.score_competition(project_no_bonus)
-    assert score == 6.0
\ No newline at end of file
+    assert score == 6.0
+
+def test_score_projects_matches_single_scoring():
+    scorer = ProjectScorer()
+    projects = [
+        {
+            "id": 1,
+            "title": "Python API integration",
+            "full_description": "Build a FastAPI service with docker deliverables.",
+            "budget": {"minimum": 300, "maximum": 600},
+            "currency_code": "USD",
+            "bid_stats": {"bid_count": 12},
+        },
+        {
+            "id": 2,
+            "title": "Fix small script bug",
+            "full_description": "Quick tweak, ASAP.",
+            "budget": {"minimum": 30, "maximum": 50},
+            "currency_code": "USD",
+            "bid_stats": {"bid_count": 45},
+        },
+    ]
+
+    batch = scorer.score_projects(projects, client_risk_scores=[None, 80])
+
+    assert [s.project_id for s in batch] == [1, 2]
+    assert batch[0].ai_score == scorer.score_project(projects[0]).ai_score
+    assert batch[1].ai_score == scorer.score_project(projects[1], client_risk_score=80).ai_score
+
+
+def test_score_project_reuses_cached_result_for_identical_content():
+    scorer = ProjectScorer(config=ScoringConfig(result_cache_ttl=300))
+    project = {
+        "id": 3,
+        "title": "Scraper",
+        "full_description": "Scrape product pages with selenium.",
+        "budget": {"minimum": 100, "maximum": 200},
+        "currency_code": "USD",
+    }
+
+    first = scorer.score_project(project)
+    second = scorer.score_project(dict(project))
+    assert second == first
+    assert scorer.cache_stats()["hits"] == 1
+
+    scorer.score_project({**project, "title": "Scraper bot"})
+    assert scorer.cache_stats()["hits"] == 1
+    assert scorer.cache_stats()["misses"] == 2
+
+
+def test_cached_score_is_immutable():
+    scorer = ProjectScorer()
+    project = {"id": 5, "title": "Scraper", "full_description": "Scrape pages."}
+
+    result = scorer.score_project(project, cache_ttl=300)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.ai_score = 0.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.score_breakdown.tech_score = 0.0
+    assert scorer.score_project(project, cache_ttl=300) == result
+    assert scorer.cache_stats()["hits"] == 1
+
+
+def test_result_cache_key_tracks_recency_window():
+    scorer = ProjectScorer()
+    submitted = time.time() - 3600
+    project = {"id": 6, "title": "Bot", "submitdate": str(submitted)}
+
+    fresh = scorer._new_batch()
+    expired = scorer._new_batch()
+    expired.recent_threshold = submitted + 1
+
+    assert scorer._result_cache_key(project, None, None, fresh) != scorer._result_cache_key(
+        project, None, None, expired
+    )
+
+
+def test_result_cache_key_tracks_currency_rates_version(monkeypatch):
+    from services import project_scorer as project_scorer_module
+
+    scorer = ProjectScorer()
+    project = {"id": 7, "title": "Bot", "currency_code": "INR"}
+    batch = scorer._new_batch()
+
+    monkeypatch.setattr(project_scorer_module, "rates_version", lambda: 1.0)
+    before = scorer._result_cache_key(project, None, None, batch)
+    monkeypatch.setattr(project_scorer_module, "rates_version", lambda: 2.0)
+
+    assert scorer._result_cache_key(project, None, None, batch) != before
+
+
+def test_score_project_cache_disabled_by_default():
+    scorer = ProjectScorer()
+    project = {"id": 4, "title": "Bot", "full_description": "Telegram bot"}
+
+    assert scorer.score_project(project) is not scorer.score_project(project)
+    assert scorer.cache_stats()["hits"] == 0
+
+
+def test_fetch_weights_from_db_does_not_mutate_shared_defaults(monkeypatch):
+    from config import settings
+    from services import project_scorer as project_scorer_module
+
+    monkeypatch.setattr(type(settings), "scoring_rules", property(lambda self: {}))
+    scorer = ProjectScorer()
+
+    class _Rule:
+        name = "tech"
+        weight = 0.4
+
+    class _Query:
+        def filter(self, *args):
+            return self
+
+        def all(self):
+            return [_Rule()]
+
+    class _DB:
+        def query(self, model):
+            return _Query()
+
+    scorer.fetch_weights_from_db(_DB())
+
+    assert scorer.weights["tech"] == 0.4
+    assert project_scorer_module._DEFAULT_WEIGHTS["tech"] == 0.10
+    assert ScoringConfig().weights["tech"] == 0.10
+
+
+def test_recency_bonus_uses_supplied_threshold():
+    scorer = ProjectScorer()
+    project = {"bid_stats": {"bid_count": 2}, "submitdate": 1_000_000_000}
+
+    assert scorer.score_competition(project) == 2.0
+    assert scorer.score_competition(project, recent_threshold=999_999_999) == 3.0
+    assert scorer.score_competition(project, recent_threshold=1_000_000_001) == 2.0
+
+
+def test_detect_risk_keywords_groups_by_category():
+    scorer = ProjectScorer(ScoringConfig(risk_keywords={
+        "vague": ["improve", "insights"],
+        "scope": ["etc"],
+        "unused": ["blockchain"],
+    }))
+    project = {"title": "Improve dashboard", "description": "Add insights, charts etc"}
+
+    assert scorer.detect_risk_keywords(project) == {
+        "vague": ["improve", "insights"],
+        "scope": ["etc"],
+    }
+
+
+@pytest.mark.parametrize(
+    "rate, expected",
+    [(-5, 0.0), (7.5, 3.0), (15, 6.0), (20, 8.0), (59.999, 9.99995), (60, 8.0),
+     (80, 6.0), (100, 5.0), (120, 4.0), (500, 4.0)],
+)
+def test_budget_efficiency_curve(rate, expected):
+    assert _budget_efficiency_score(rate) == pytest.approx(expected)
+
+
+def test_configure_scorer_rebuilds_singleton():
+    from services import project_scorer as project_scorer_module
+
+    project_scorer_module.reset_singleton()
+    try:
+        default_scorer = project_scorer_module.get_project_scorer()
+        assert project_scorer_module.get_project_scorer() is default_scorer
+
+        config = ScoringConfig(user_skills=["python"])
+        project_scorer_module.configure_scorer(config)
+        configured = project_scorer_module.get_project_scorer()
+        assert configured is not default_scorer
+        assert configured.config is config
+    finally:
+        project_scorer_module.reset_singleton()
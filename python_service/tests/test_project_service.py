@@ -0,0 +1,219 @@
+import asyncio
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PYTHON_SERVICE = REPO_ROOT / "python_service"
+sys.path.insert(0, str(PYTHON_SERVICE))
+
+from config import settings
+from database.connection import Base
+from database.models import Project
+from services import project_service
+from services.project_service import _check_skill_match, _pre_filter_projects
+
+
+def test_check_skill_match_text_and_jobs(monkeypatch):
+    monkeypatch.setattr(settings, "RESUME_SKILL_MAPPINGS", {1: ["FastAPI", "docker"]})
+
+    assert _check_skill_match({"title": "Build a FastAPI service"})
+    assert _check_skill_match({"title": "Backend work", "jobs": [{"name": "Docker"}]})
+    assert not _check_skill_match({"title": "Logo design", "jobs": [{"name": "Photoshop"}]})
+
+
+def test_pre_filter_projects_status_and_skill(monkeypatch):
+    monkeypatch.setattr(settings, "RESUME_SKILL_MAPPINGS", {1: ["python"]})
+    projects = [
+        {"title": "Python scraper", "status": "Active", "type": "fixed"},
+        {"title": "Python bot", "status": "closed", "type": "fixed"},
+        {"title": "Logo design", "status": "open", "type": "fixed"},
+    ]
+
+    kept, stats = _pre_filter_projects(projects, allowed_statuses=["OPEN", "active"])
+
+    assert [p["title"] for p in kept] == ["Python scraper"]
+    assert stats["filtered_status"] == 1
+    assert stats["filtered_skill"] == 1
+
+
+@pytest.fixture
+def memory_session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def test_search_projects_sync_upserts_batch(
+    monkeypatch, memory_session_factory
+):
+    with memory_session_factory() as seed:
+        seed.add(Project(freelancer_id=1, title="Old title", status="bid_submitted"))
+        seed.commit()
+
+    api_projects = [
+        {"id": 1, "title": "Python API", "status": "open", "description": "x" * 40},
+        {"id": 2, "title": "Python bot", "status": "open", "description": "y" * 40},
+        {
+            "id": 2,
+            "title": "Python bot v2",
+            "status": "open",
+            "description": "y" * 40,
+            "type": "fixed",
+            "jobs": [{"id": 13, "name": "Python"}, {"id": 95, "name": "Bots"}],
+        },
+    ]
+
+    class _Client:
+        async def search_projects(self, **kwargs):
+            return api_projects
+
+    @contextmanager
+    def _session():
+        session = memory_session_factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    monkeypatch.setattr(settings, "RESUME_SKILL_MAPPINGS", {1: ["python"]})
+    monkeypatch.setattr(settings, "MIN_BUDGET_THRESHOLD", None)
+    monkeypatch.setattr(project_service, "get_freelancer_client", lambda: _Client())
+    monkeypatch.setattr(project_service, "get_db_session", _session)
+
+    selects = []
+    engine = memory_session_factory.kw["bind"]
+
+    def _count_selects(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count_selects)
+    with memory_session_factory() as db:
+        asyncio.run(project_service.search_projects(db, sync_from_api=True))
+        event.remove(engine, "before_cursor_execute", _count_selects)
+        rows = {
+            p.freelancer_id: (p.title, p.status, p.type_id, p.watched, p.skills)
+            for p in db.query(Project).all()
+        }
+
+    assert rows == {
+        1: ("Python API", "bid_submitted", None, False, None),
+        2: ("Python bot v2", "open", 1, False, "[13,95]"),
+    }
+    # 同步阶段只有一次批量查询（另一条来自随后的本地列表查询）
+    assert len(selects) == 2
+
+
+def test_pre_filter_projects_checks_budget_last(monkeypatch):
+    requested = []
+
+    class _Converter:
+        def get_rates_sync(self, codes):
+            codes = list(codes)
+            requested.extend(codes)
+            return {code: {"USD": 1.0, "EUR": 1.1}[code] for code in codes}
+
+    monkeypatch.setattr(settings, "RESUME_SKILL_MAPPINGS", {1: ["python"]})
+    monkeypatch.setattr(project_service, "get_currency_converter", lambda: _Converter())
+    projects = [
+        {"title": "Python ETL", "budget": {"maximum": 100}, "currency": {"code": "EUR"}},
+        {"title": "Python tweak", "budget": {"maximum": 2}, "currency": {"code": "USD"}},
+        {"title": "Logo design", "budget": {"maximum": 500}, "currency": {"code": "GBP"}},
+    ]
+
+    kept, stats = _pre_filter_projects(projects, budget_min_threshold=5.0)
+
+    assert [p["title"] for p in kept] == ["Python ETL"]
+    assert sorted(requested) == ["EUR", "USD"]
+    assert stats["filtered_skill"] == 1
+    assert stats["filtered_budget"] == 1
+    assert stats["kept"] == 1
+
+
+def test_project_indexes_created_on_existing_table(memory_session_factory):
+    from sqlalchemy import inspect, text
+    from database.connection import _migrate_project_indexes
+
+    engine = memory_session_factory.kw["bind"]
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_projects_status_created_type"))
+        conn.execute(text(
+            "INSERT INTO projects (freelancer_id, title, status) VALUES (7, 't', 'Active')"
+        ))
+
+    _migrate_project_indexes(engine)
+    _migrate_project_indexes(engine)
+
+    names = {index["name"] for index in inspect(engine).get_indexes("projects")}
+    assert {"idx_projects_status_created_type", "idx_projects_ai_score_scored"} <= names
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT status FROM projects")).scalar() == "active"
+
+
+def test_status_normalization_runs_only_before_index_exists(memory_session_factory):
+    from sqlalchemy import text
+    from database.connection import _migrate_project_indexes
+
+    engine = memory_session_factory.kw["bind"]
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO projects (freelancer_id, title, status) VALUES (8, 't', 'Active')"
+        ))
+
+    # 索引已存在：视为迁移完成，不再全表扫描改写状态
+    _migrate_project_indexes(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT status FROM projects")).scalar() == "Active"
+
+
+def test_parse_submit_timestamp_formats():
+    from services.project_service import _parse_submit_timestamp
+
+    assert _parse_submit_timestamp(1_700_000_000_000) == 1_700_000_000
+    assert _parse_submit_timestamp("1700000000") == 1_700_000_000
+    assert _parse_submit_timestamp("2023-11-14T22:13:20Z") == 1_700_000_000
+    assert _parse_submit_timestamp("2023-11-14T22:13:20Z") == 1_700_000_000
+    assert _parse_submit_timestamp("not a date") is None
+    assert _parse_submit_timestamp("  ") is None
+    assert _parse_submit_timestamp(None) is None
+
+
+def test_search_projects_rows_match_to_dict(memory_session_factory):
+    with memory_session_factory() as db:
+        db.add(Project(
+            freelancer_id=5,
+            title="Scraper",
+            status="open",
+            budget_maximum=250,
+            bid_stats='{"bid_count": 4}',
+            owner_info="not json",
+        ))
+        db.commit()
+
+        listed = asyncio.run(project_service.search_projects(db, allowed_statuses=["open"]))
+        expected = [p.to_dict() for p in db.query(Project).all()]
+
+    assert listed == expected
+    assert listed[0]["bid_stats"] == {"bid_count": 4}
+
+
+def test_project_to_dict_json_columns_are_independent():
+    a = Project(freelancer_id=6, title="Bot", bid_stats='{"bid_count": 9}', owner_info="not json")
+    b = Project(freelancer_id=7, title="Bot", bid_stats='{"bid_count": 9}')
+
+    first = a.to_dict()
+    assert first["bid_stats"] == {"bid_count": 9}
+    assert first["owner_info"] == "not json"
+
+    first["bid_stats"]["bid_count"] = 99
+    assert a.to_dict()["bid_stats"] == {"bid_count": 9}
+    assert b.to_dict()["bid_stats"] == {"bid_count": 9}
@@ -26,6 +26,7 @@ from services.proposal_service import (
     DefaultPersonaController,
     LLMClientProtocol,
     MultiProviderLLMClientAdapter,
+    OpenAILLMClientAdapter,
 )
 from database.models import Project
 
@@ -654,6 +655,119 @@ class TestFallbackMechanism:
         # Fallback may or may not be used depending on error handling
 
 
+class TestRetryBackoff:
+    """Tests for retry backoff on transient LLM errors."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried_with_exponential_backoff(
+        self, sample_project, proposal_config, monkeypatch
+    ):
+        proposal_config.max_retries = 3
+        proposal_config.validate_before_return = False
+        client = MagicMock(spec=LLMClientProtocol)
+        client.generate_proposal = AsyncMock(
+            side_effect=[TimeoutError("timed out"), TimeoutError("timed out"), "Final proposal"]
+        )
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(proposal_service_module.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(proposal_service_module.random, "uniform", lambda a, b: b)
+
+        service = ProposalService(llm_client=client, config=proposal_config)
+        result = await service.generate_proposal(sample_project)
+
+        assert result["success"] is True
+        assert result["attempts"] == 3
+        assert delays == [2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_non_retriable_error_fails_fast(
+        self, sample_project, proposal_config, monkeypatch
+    ):
+        proposal_config.max_retries = 3
+        client = MagicMock(spec=LLMClientProtocol)
+        client.generate_proposal = AsyncMock(side_effect=ValueError("bad request"))
+        sleep = AsyncMock()
+        monkeypatch.setattr(proposal_service_module.asyncio, "sleep", sleep)
+
+        service = ProposalService(llm_client=client, config=proposal_config)
+        result = await service.generate_proposal(sample_project)
+
+        assert result["success"] is False
+        assert result["attempts"] == 1
+        assert result["error"] == "bad request"
+        sleep.assert_not_awaited()
+
+    def test_retry_delay_is_capped(self, proposal_config):
+        proposal_config.retry_max_delay = 5.0
+        service = ProposalService(
+            llm_client=MagicMock(spec=LLMClientProtocol), config=proposal_config
+        )
+
+        assert service._retry_delay(10) == 5.0
+
+    def test_multi_provider_error_keeps_retriable_cause(self):
+        error = RuntimeError("All proposal LLM providers failed")
+        error.__cause__ = TimeoutError("timed out")
+
+        assert proposal_service_module._is_retriable_llm_error(error)
+        assert proposal_service_module._is_retriable_llm_error(
+            proposal_service_module.EmptyLLMResponseError("LLM returned empty content")
+        )
+        assert not proposal_service_module._is_retriable_llm_error(
+            RuntimeError("invalid api key")
+        )
+
+
+class TestBatchGeneration:
+    """Tests for concurrent batch proposal generation."""
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order_and_bounds_concurrency(
+        self, sample_project, proposal_config, monkeypatch
+    ):
+        service = ProposalService(
+            llm_client=MagicMock(spec=LLMClientProtocol), config=proposal_config
+        )
+        active = 0
+        peak = 0
+
+        async def fake_generate(project, score_data=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if score_data and score_data.get("boom"):
+                raise RuntimeError("boom")
+            return {"success": True, "proposal": f"p-{score_data['n']}"}
+
+        monkeypatch.setattr(service, "generate_proposal", fake_generate)
+
+        results = await service.generate_proposals_batch(
+            [sample_project] * 5,
+            score_data=[{"n": 0}, {"n": 1}, {"boom": True}, {"n": 3}, {"n": 4}],
+            max_concurrency=2,
+        )
+
+        assert peak == 2
+        assert [r["proposal"] for r in results] == ["p-0", "p-1", "", "p-3", "p-4"]
+        assert results[2]["success"] is False
+        assert results[2]["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_mismatched_score_data(self, sample_project, proposal_config):
+        service = ProposalService(
+            llm_client=MagicMock(spec=LLMClientProtocol), config=proposal_config
+        )
+
+        with pytest.raises(ValueError):
+            await service.generate_proposals_batch([sample_project], score_data=[])
+
+
 class TestServiceReset:
     """Tests for service singleton management."""
 
@@ -689,10 +803,11 @@ class TestProviderFallbackAndTimeout:
         captured = {}
 
         class DummyMultiProvider:
-            def __init__(self, providers, default_model, timeout=None):
+            def __init__(self, providers, default_model, timeout=None, max_output_tokens=2000):
                 captured["providers"] = providers
                 captured["default_model"] = default_model
                 captured["timeout"] = timeout
+                captured["max_output_tokens"] = max_output_tokens
 
             async def generate_proposal(
                 self,
@@ -731,6 +846,9 @@ class TestProviderFallbackAndTimeout:
         assert service.llm_client is not None
         assert captured["providers"][0]["name"] == "zhipu"
         assert captured["providers"][1]["name"] == "deepseek"
+        assert captured["max_output_tokens"] == min(
+            2000, int(proposal_config.max_length * 1.5)
+        )
 
     @pytest.mark.asyncio
     async def test_multi_provider_fallback_uses_secondary_provider(self, monkeypatch):
@@ -744,6 +862,7 @@ class TestProviderFallbackAndTimeout:
                 base_url: str | None = None,
                 timeout: float | None = None,
                 provider_name: str = "openai",
+                max_output_tokens: int = 2000,
             ):
                 self.provider_name = provider_name
 
@@ -781,6 +900,27 @@ class TestProviderFallbackAndTimeout:
         assert proposal == "secondary provider proposal"
         assert call_order == ["openai", "zhipu"]
 
+    @pytest.mark.asyncio
+    async def test_openai_adapter_bounds_output_tokens_and_disables_sdk_retries(self):
+        pytest.importorskip("openai")
+        adapter = OpenAILLMClientAdapter(
+            api_key="k", model="m", timeout=5.0, max_output_tokens=1200
+        )
+        assert adapter._client.max_retries == 0
+
+        message = MagicMock()
+        message.message.content = " proposal "
+        create = AsyncMock(return_value=MagicMock(choices=[message]))
+        adapter._client = MagicMock()
+        adapter._client.chat.completions.create = create
+
+        result = await adapter.generate_proposal(
+            system_prompt="s", user_prompt="u", model="m", temperature=0.5
+        )
+
+        assert result == "proposal"
+        assert create.await_args.kwargs["max_tokens"] == 1200
+
     @pytest.mark.asyncio
     async def test_proposal_service_enforces_timeout(self, sample_project):
         class SlowClient:
@@ -0,0 +1,202 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from services.proposal_metrics import ProposalMetricsCollector
+
+
+def _record_samples(collector):
+    collector.record_proposal("p1", 1, "## Plan\nCan we talk?", generation_time_ms=100)
+    collector.record_proposal(
+        "p2",
+        2,
+        "Plain proposal text",
+        validation_result={"is_valid": False, "issues": ["Forbidden phrase", "Too short"]},
+        generation_time_ms=300,
+    )
+
+
+def test_average_metrics_from_running_totals():
+    collector = ProposalMetricsCollector()
+    _record_samples(collector)
+
+    summary = collector.get_average_metrics()
+    assert summary.total_proposals == 2
+    assert summary.avg_length == (len("## Plan\nCan we talk?") + len("Plain proposal text")) / 2
+    assert summary.avg_word_count == 4.0
+    assert summary.question_rate == 50.0
+    assert summary.markdown_header_rate == 50.0
+    assert summary.avg_validation_issues == 1.0
+    assert summary.pass_rate == 50.0
+    assert summary.avg_generation_time_ms == 200.0
+
+    collector.clear_metrics()
+    assert collector.get_average_metrics().total_proposals == 0
+
+
+def test_totals_rebuilt_from_storage(tmp_path):
+    storage = tmp_path / "metrics.json"
+    collector = ProposalMetricsCollector(storage_path=storage)
+    _record_samples(collector)
+    collector.close()
+
+    reloaded = ProposalMetricsCollector(storage_path=storage)
+    assert reloaded.get_average_metrics() == collector.get_average_metrics()
+
+
+def test_storage_appends_one_line_per_record(tmp_path):
+    storage = tmp_path / "metrics.jsonl"
+    collector = ProposalMetricsCollector(storage_path=storage, flush_every=2)
+    collector.record_proposal("p0", 3, "buffered")
+    assert storage.read_text(encoding="utf-8") == ""
+    collector.clear_metrics()
+
+    _record_samples(collector)
+
+    lines = storage.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["proposal_id"] for line in lines] == ["p1", "p2"]
+
+    # 半行写入（如进程中断）不影响其余记录的加载
+    with open(storage, "a", encoding="utf-8") as f:
+        f.write('{"proposal_id": "p3"')
+    assert ProposalMetricsCollector(storage_path=storage).get_average_metrics().total_proposals == 2
+
+    collector.clear_metrics()
+    assert storage.read_text(encoding="utf-8") == ""
+    collector.close()
+
+
+def test_records_after_crash_survive_restart(tmp_path):
+    storage = tmp_path / "metrics.jsonl"
+    collector = ProposalMetricsCollector(storage_path=storage)
+    collector.record_proposal("a", 1, "first")
+    collector.close()
+    # 模拟崩溃：最后一行只写了一半且没有换行
+    with open(storage, "a", encoding="utf-8") as f:
+        f.write('{"proposal_id": "b"')
+
+    restarted = ProposalMetricsCollector(storage_path=storage)
+    assert storage.read_text(encoding="utf-8").endswith("\n")
+    restarted.record_proposal("c", 1, "second")
+    restarted.close()
+
+    reloaded = ProposalMetricsCollector(storage_path=storage)
+    assert [m.proposal_id for m in reloaded._metrics] == ["a", "c"]
+    reloaded.close()
+
+
+def test_legacy_json_array_storage_is_converted(tmp_path):
+    storage = tmp_path / "metrics.json"
+    collector = ProposalMetricsCollector()
+    _record_samples(collector)
+    storage.write_text(json.dumps([m.to_dict() for m in collector._metrics], indent=2), encoding="utf-8")
+
+    reloaded = ProposalMetricsCollector(storage_path=storage)
+    assert reloaded.get_average_metrics() == collector.get_average_metrics()
+    assert len(storage.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_export_metrics(tmp_path):
+    collector = ProposalMetricsCollector()
+    _record_samples(collector)
+
+    output = tmp_path / "export.json"
+    exported = json.loads(collector.export_metrics(output))
+    assert [m["proposal_id"] for m in exported["metrics"]] == ["p1", "p2"]
+    assert exported["metrics"][1]["validation_issues"] == ["Forbidden phrase", "Too short"]
+    assert exported["summary"] == collector.get_average_metrics().to_dict()
+    assert json.loads(output.read_text(encoding="utf-8")) == exported
+
+
+def test_to_dict_matches_asdict():
+    from dataclasses import asdict
+
+    metrics = ProposalMetricsCollector().record_proposal(
+        "p1", 1, "text", validation_result={"is_valid": False, "issues": ["Too short"]}
+    )
+
+    assert metrics.to_dict() == asdict(metrics)
+    assert metrics.to_dict()["validation_issues"] is metrics.validation_issues
+    assert metrics.to_dict(copy=True)["validation_issues"] is not metrics.validation_issues
+
+
+def test_forbidden_phrases_count_is_case_insensitive():
+    metrics = ProposalMetricsCollector().record_proposal(
+        "p1",
+        1,
+        "text",
+        validation_result={
+            "is_valid": False,
+            "issues": ["FORBIDDEN phrase: synergy", "Prohibited header", "Too short"],
+        },
+    )
+
+    assert metrics.forbidden_phrases_count == 2
+
+
+def test_get_metrics_by_project():
+    collector = ProposalMetricsCollector()
+    _record_samples(collector)
+    collector.record_proposal("p3", 1, "Another proposal")
+
+    assert [m.proposal_id for m in collector.get_metrics_by_project(1)] == ["p1", "p3"]
+    assert collector.get_metrics_by_project(99) == []
+
+    collector.clear_metrics()
+    assert collector.get_metrics_by_project(1) == []
+
+
+def test_load_record_without_defaulted_fields(tmp_path):
+    storage = tmp_path / "metrics.jsonl"
+    record = ProposalMetricsCollector().record_proposal("p1", 1, "text").to_dict(copy=True)
+    for key in ("validation_issues", "generation_time_ms", "model_used", "timestamp"):
+        del record[key]
+    storage.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+    loaded = ProposalMetricsCollector(storage_path=storage).get_metrics_by_project(1)
+    assert len(loaded) == 1
+    assert loaded[0].model_used == "unknown"
+    assert loaded[0].validation_issues == []
+
+
+def test_get_metrics_collector_singleton(tmp_path):
+    from services.proposal_metrics import get_metrics_collector, reset_collector
+
+    reset_collector()
+    try:
+        collector = get_metrics_collector(storage_path=tmp_path / "metrics.jsonl")
+        assert get_metrics_collector() is collector
+        assert get_metrics_collector(storage_path=tmp_path / "other.jsonl") is collector
+    finally:
+        reset_collector()
+    assert get_metrics_collector() is not collector
+    reset_collector()
+
+
+def test_export_metrics_reused_until_records_change():
+    collector = ProposalMetricsCollector()
+    _record_samples(collector)
+
+    first = collector.export_metrics()
+    assert collector.export_metrics() is first
+
+    collector.record_proposal("p3", 3, "More text")
+    changed = collector.export_metrics()
+    assert changed is not first
+    assert len(json.loads(changed)["metrics"]) == 3
+
+    collector.clear_metrics()
+    assert json.loads(collector.export_metrics())["metrics"] == []
+
+
+def test_markdown_header_detection():
+    collector = ProposalMetricsCollector()
+    cases = {
+        "Plain text, no headers": False,
+        "  # Title\nBody": True,
+        "Intro\n### Section": True,
+        "Use C# for this": False,
+    }
+    for text, expected in cases.items():
+        assert collector.record_proposal("p", 1, text).has_markdown_headers is expected
@@ -32,6 +32,16 @@ class TestProposalPromptBuilder:
         assert "Build a Website" in context
         assert "500-1000 USD" in context
 
+    def test_build_project_context_skill_shapes(self, builder, sample_project):
+        def skills_line(skills):
+            context = builder.build_project_context(dict(sample_project, skills=skills))
+            return next((line for line in context.splitlines() if line.startswith("- 技能要求")), None)
+
+        assert skills_line(["Python", 3, "Docker"]) == "- 技能要求：Python, 3, Docker"
+        assert skills_line('"Python"') == "- 技能要求：Python"
+        assert skills_line('{"name": "Python"}') is None
+        assert skills_line([]) is None
+
     def test_build_project_context_with_score(self, builder, sample_project):
         score_data = {"score": 8.5, "reason": "Good budget.", "suggested_bid": 750}
         context = builder.build_project_context(sample_project, score_data)
@@ -63,6 +73,63 @@ class TestProposalPromptBuilder:
         assert "Sentence Variety" in prompt
         assert "Project-Specific Detail" in prompt
 
+    def test_build_prompt_reuses_skeleton_per_style(self, builder, sample_project):
+        other = dict(sample_project, title="Build a {templated} Scraper", description="Scrape data")
+        first = builder.build_prompt(sample_project)
+        second = builder.build_prompt(other)
+        assert list(builder._prompt_skeletons) == [("narrative", "three_step")]
+        assert "Build a {templated} Scraper" in second
+        assert first.split("高质量投标参考")[1] == second.split("高质量投标参考")[1]
+
+        builder.build_prompt(sample_project, style="default", structure="default")
+        assert len(builder._prompt_skeletons) == 2
+
+    def test_context_memoized_per_content(self, builder, sample_project, monkeypatch):
+        from config import settings
+        from services import proposal_prompt_builder as module
+
+        module._format_project_context.cache_clear()
+        module._format_resume_context.cache_clear()
+        first = builder.build_project_context(sample_project)
+        assert builder.build_project_context(dict(sample_project)) == first
+        assert module._format_project_context.cache_info().hits == 1
+        # 数值类型不同的字段不共用缓存项
+        assert "500.0-1000 USD" in builder.build_project_context(dict(sample_project, budget_minimum=500.0))
+
+        resume = builder.build_resume_context(sample_project)
+        assert builder.build_resume_context(sample_project) == resume
+        assert module._format_resume_context.cache_info().hits == 1
+        # 不同文本命中相同分类时共用缓存项（缓存键不含项目原文）
+        renamed = dict(sample_project, title=str(sample_project["title"]) + " v2")
+        assert builder.build_resume_context(renamed) == resume
+        assert module._format_resume_context.cache_info().hits == 2
+
+        monkeypatch.setattr(settings, "RESUME_SKILL_MAPPINGS", {107: ["website"]})
+        assert "FFmpeg" in builder.build_resume_context(sample_project)
+
+    def test_reference_samples_shared_across_instances(self, builder):
+        reset_prompt_builder()
+        other = get_proposal_prompt_builder()
+        assert other is not builder
+        assert other._load_bid_reference_samples() is builder._load_bid_reference_samples()
+
+    def test_warmup_prompt_builder(self):
+        from services import proposal_prompt_builder as module
+
+        reset_prompt_builder()
+        module.warmup_prompt_builder()
+        assert module._resume_highlights.cache_info().currsize == 1
+        assert module._render_bid_reference_context.cache_info().currsize == 1
+        assert ("narrative", "three_step") in get_proposal_prompt_builder()._prompt_skeletons
+
+    def test_build_scoring_prompt_dedupes_identical_projects(self, builder, sample_project):
+        first = builder.build_scoring_prompt(sample_project)
+        assert builder.build_scoring_prompt(dict(sample_project)) is first
+        assert "Build a Website" in first and builder.base_system_prompt in first
+
+        builder.base_system_prompt = "Custom scoring rules"
+        assert "Custom scoring rules" in builder.build_scoring_prompt(sample_project)
+
     def test_get_system_prompt_for_scoring(self, builder):
         prompt = builder.get_system_prompt_for_scoring()
         assert "EVALUATION WORKFLOW" in prompt
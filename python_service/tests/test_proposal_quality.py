@@ -535,6 +535,15 @@ class TestValidatorQualityChecks:
             )
             assert not is_valid or any("空行" in i for i in issues)
 
+    def test_validator_counts_whitespace_only_lines_as_empty(self):
+        """Lines holding only spaces, tabs or NBSP count as empty lines."""
+        validator = DefaultProposalValidator(min_length=1, max_length=2000)
+        proposal = "第一段内容。\n \t\n\xa0\n第二段内容。\n"
+
+        _, issues = validator.validate(proposal, {"title": "Test"})
+
+        assert "空行过多（3/5）" in issues
+
     def test_validator_rejects_duplicate_sentences(self):
         """Test that validator detects duplicate sentences."""
         validator = DefaultProposalValidator(min_length=200, max_length=800)
@@ -550,6 +559,33 @@ class TestValidatorQualityChecks:
         has_duplicate_check = any("重复" in i for i in issues)
         assert has_duplicate_check or len(duplicate_proposal) < validator.min_length
 
+    def test_validator_counts_template_phrases_and_sections(self):
+        """Template phrases and structure words are counted once per distinct phrase."""
+        validator = DefaultProposalValidator(min_length=10, max_length=2000)
+        phrases = DefaultProposalValidator.COMMON_PHRASES
+        templated = "。".join([phrases[0], phrases[1], phrases[2], phrases[0]])
+
+        is_valid, issues = validator.validate(templated, {"title": "Test"})
+
+        assert not is_valid
+        assert "AI 模板化内容过多 (3处)" in issues
+        assert "缺乏结构化表达（技术方案/交付计划）" in issues
+
+        _, issues = validator.validate(
+            "Delivery PLAN covers the API integration and the reporting approach.",
+            {"title": "Test"},
+        )
+        assert not any("模板化" in i or "结构化" in i for i in issues)
+
+    def test_validator_reports_full_duplicate_sentence_count(self):
+        """Every repeated sentence is counted, ignoring surrounding whitespace."""
+        validator = DefaultProposalValidator(min_length=1, max_length=2000)
+        proposal = "句子一。 句子一。句子二。句子二 。句子一。句子三。"
+
+        _, issues = validator.validate(proposal, {"title": "Test"})
+
+        assert "存在重复句式 (3处)" in issues
+
 
 class TestPromptBuilderCompliance:
     """Tests for verifying compliance with prompt builder requirements."""
@@ -102,6 +102,43 @@ validation_rules:
         # Unknown keys are allowed but warned about
         assert result is True
 
+    def test_load_config_reuses_parsed_file_until_changed(self, tmp_path):
+        from services import proposal_config_loader
+
+        config_file = tmp_path / "bid_prompts.yaml"
+        config_file.write_text('version: "2.0"\npersonas:\n  backend:\n    name: Backend\n')
+        ProposalConfigLoader.reset()
+        try:
+            assert ProposalConfigLoader.load_config(str(config_file)) is True
+            assert ProposalConfigLoader.load_config(str(config_file)) is True
+            assert proposal_config_loader._parse_config_file.cache_info().hits == 1
+            assert ProposalConfigLoader.get_personas()["backend"]["name"] == "Backend"
+
+            # 修改已加载的配置不能污染解析缓存
+            ProposalConfigLoader.get_personas()["backend"]["name"] = "Mutated"
+            assert ProposalConfigLoader.load_config(str(config_file)) is True
+            assert ProposalConfigLoader.get_personas()["backend"]["name"] == "Backend"
+
+            config_file.write_text('version: "2.0"\nstyles:\n  narrative: {}\n')
+            assert ProposalConfigLoader.load_config(str(config_file)) is True
+            assert ProposalConfigLoader.get_personas() == {}
+            assert "narrative" in ProposalConfigLoader.get_styles()
+        finally:
+            ProposalConfigLoader.reset()
+
+    def test_load_config_empty_and_utf8_files(self, tmp_path):
+        config_file = tmp_path / "bid_prompts.yaml"
+        config_file.write_text("")
+        ProposalConfigLoader.reset()
+        try:
+            assert ProposalConfigLoader.load_config(str(config_file)) is False
+
+            config_file.write_text('version: "2.0"\npersonas:\n  backend:\n    name: 后端\n', encoding="utf-8")
+            assert ProposalConfigLoader.load_config(str(config_file)) is True
+            assert ProposalConfigLoader.get_personas()["backend"]["name"] == "后端"
+        finally:
+            ProposalConfigLoader.reset()
+
 
 class TestProposalTechAccuracy:
     """Tests for P2: Technical Accuracy Validation"""
@@ -5,7 +5,7 @@ import json
 import logging
 import os
 import time
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -135,6 +135,33 @@ class CurrencyConverter:
             logger.warning(f"Exchange rate for {currency_code} not found, no fallback available")
         return rate
 
+    def get_rates_sync(self, currency_codes: Iterable[str]) -> Dict[str, Optional[float]]:
+        """
+        Get exchange rates for several currencies (to USD) synchronously.
+
+        The cache is refreshed at most once for the whole set (a single API
+        request returns every rate), instead of once per missing currency.
+        Keys of the result are the codes as passed in.
+        """
+        normalized = {code: code.upper() for code in set(currency_codes)}
+        needed = {c for c in normalized.values() if c != "USD"}
+        if needed and (not self.is_cache_valid() or not needed <= self.rates.keys()):
+            logger.info(f"Rates for {sorted(needed)} missing or cache expired, updating (sync)...")
+            self.update_rates_sync()
+
+        result: Dict[str, Optional[float]] = {}
+        for code, upper in normalized.items():
+            if upper == "USD":
+                result[code] = 1.0
+                continue
+            rate = self.rates.get(upper)
+            if rate is None:
+                rate = self.FALLBACK_RATES.get(upper)
+            if rate is None:
+                logger.warning(f"Exchange rate for {upper} not found, no fallback available")
+            result[code] = rate
+        return result
+
     async def get_rate(self, currency_code: str) -> Optional[float]:
         """
         Get the exchange rate for a currency (to USD).
@@ -166,3 +193,13 @@ def get_currency_converter() -> CurrencyConverter:
     if _converter is None:
         _converter = CurrencyConverter()
     return _converter
+
+
+def rates_version() -> float:
+    """
+    Timestamp of the singleton's current rates (0.0 if no converter exists yet).
+
+    Changes whenever rates are refreshed, so it can be used in cache keys of
+    values derived from exchange rates. Does not create the converter.
+    """
+    return _converter.last_updated if _converter is not None else 0.0
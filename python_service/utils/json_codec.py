@@ -0,0 +1,68 @@
+"""
+JSON 序列化工具。
+
+说明：
+- 安装了 orjson 时使用其 C 实现进行编码/解码；否则回退为标准库 json
+- 输出始终为 str，可直接写入 Text 列，并可被 json.loads 解析
+- orjson 不支持的输入（如非字符串字典键）自动回退到标准库
+- dumps_indented 用于导出：2 空格缩进，dataclass 直接序列化
+- loads 每次返回新对象；orjson 拒绝的输入（NaN、超 64 位整数等）回退到标准库，
+  因此解析结果与异常类型均与 json.loads 一致
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any, Optional
+
+try:  # 可选依赖：orjson
+    import orjson
+except ImportError:  # pragma: no cover - 取决于运行环境
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    """将对象编码为 JSON 字符串（UTF-8 字符原样保留）。"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Any) -> Any:
+    """解析 JSON 文本（str/bytes），语义与 json.loads 相同。"""
+    if orjson is not None and isinstance(data, (str, bytes)):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_or_none(value: Any) -> Optional[str]:
+    """空值（None / {} / []）返回 None，其余编码为 JSON 字符串。"""
+    return dumps(value) if value else None
+
+
+def _default(value: Any) -> Any:
+    """标准库回退时的兜底：dataclass 转 dict，其余类型转为 str。"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def dumps_indented(value: Any) -> str:
+    """编码为 2 空格缩进的 JSON 字符串；dataclass 原生支持，未知类型转为 str。"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False, default=_default)
@@ -0,0 +1,77 @@
+"""
+多关键词子串匹配工具。
+
+说明：
+- 关键词分组在构造时一次性编译，匹配时对文本只扫描一遍
+- 安装了 pyahocorasick 时使用 Aho-Corasick 自动机；否则回退为逐关键词 `in` 检查
+- 两种实现的匹配语义与 `keyword in text` 完全一致（子串匹配，区分大小写，
+  调用方负责事先统一大小写）
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+try:  # 可选依赖：pyahocorasick
+    import ahocorasick
+except ImportError:  # pragma: no cover - 取决于运行环境
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    预编译的分组关键词匹配器。
+
+    Example:
+        matcher = KeywordMatcher({"risk": ["asap", "urgent"], "tech": ["python"]})
+        matcher.find("need python asap")  # {"risk": ["asap"], "tech": ["python"]}
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        # 保留配置中的关键词顺序（含重复项），以便输出与原始列表推导一致
+        self._groups: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (name, tuple(kw for kw in keywords if kw)) for name, keywords in groups.items()
+        )
+        self._keywords: FrozenSet[str] = frozenset(
+            kw for _, keywords in self._groups for kw in keywords
+        )
+
+        self._automaton = None
+        if ahocorasick is not None and self._keywords:
+            automaton = ahocorasick.Automaton()
+            for kw in self._keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def hits(self, text: str) -> FrozenSet[str]:
+        """返回文本中出现的所有关键词（去重）。"""
+        if not text:
+            return frozenset()
+        if self._automaton is not None:
+            return frozenset(kw for _, kw in self._automaton.iter(text))
+        return frozenset(kw for kw in self._keywords if kw in text)
+
+    def contains_any(self, text: str) -> bool:
+        """文本中是否出现任意关键词（命中第一个即返回）。"""
+        if not text:
+            return False
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(kw in text for kw in self._keywords)
+
+    def find(self, *texts: str) -> Dict[str, List[str]]:
+        """
+        匹配一段或多段文本，返回 {分组名: 命中的关键词列表}。
+
+        多段文本分别扫描（不会跨段拼接产生误匹配），未命中的分组不出现在结果中。
+        """
+        found: FrozenSet[str] = frozenset().union(*(self.hits(t) for t in texts))
+        if not found:
+            return {}
+        result: Dict[str, List[str]] = {}
+        for name, keywords in self._groups:
+            matched = [kw for kw in keywords if kw in found]
+            if matched:
+                result[name] = matched
+        return result